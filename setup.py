@@ -1,71 +1,152 @@
+import argparse
+import asyncio
+import hashlib
+import os
 import platform
+import re
+import tempfile
 from pathlib import Path
 
 from src.config.loader import load_config
 from src.config.schema import AppConfig, AudioConfig, TTSConfig, WakeWordConfig
-from src.config.utils import get_wake_word_model_dir, get_tts_model_path
-
-# Piper model URLs from https://github.com/rhasspy/piper/blob/master/VOICES.md
-PIPER_MODELS = {
-    "en_US-lessac-medium": {
-        "onnx": "https://huggingface.co/rhasspy/piper-voices/resolve/v1.0.0/en/en_US/lessac/medium/en_US-lessac-medium.onnx",
-        "json": "https://huggingface.co/rhasspy/piper-voices/resolve/v1.0.0/en/en_US/lessac/medium/en_US-lessac-medium.onnx.json",
-    },
-    "en_US-amy-medium": {
-        "onnx": "https://huggingface.co/rhasspy/piper-voices/resolve/v1.0.0/en/en_US/amy/medium/en_US-amy-medium.onnx",
-        "json": "https://huggingface.co/rhasspy/piper-voices/resolve/v1.0.0/en/en_US/amy/medium/en_US-amy-medium.onnx.json",
-    },
-    "en_GB-alan-medium": {
-        "onnx": "https://huggingface.co/rhasspy/piper-voices/resolve/v1.0.0/en/en_GB/alan/medium/en_GB-alan-medium.onnx",
-        "json": "https://huggingface.co/rhasspy/piper-voices/resolve/v1.0.0/en/en_GB/alan/medium/en_GB-alan-medium.onnx.json",
-    },
-    "en_GB-cori-medium": {
-        "onnx": "https://huggingface.co/rhasspy/piper-voices/resolve/v1.0.0/en/en_GB/cori/medium/en_GB-cori-medium.onnx",
-        "json": "https://huggingface.co/rhasspy/piper-voices/resolve/v1.0.0/en/en_GB/cori/medium/en_GB-cori-medium.onnx.json",
-    },
-    "en_GB-northern-english-male": {
-        "onnx": "https://huggingface.co/rhasspy/piper-voices/resolve/v1.0.0/en/en_GB/northern_english_male/medium/en_GB-northern_english_male-medium.onnx",
-        "json": "https://huggingface.co/rhasspy/piper-voices/resolve/v1.0.0/en/en_GB/northern_english_male/medium/en_GB-northern_english_male-medium.onnx.json",
-    },
-}
-
-
-def download_tts_model(config: TTSConfig):
-    """Download Piper TTS model if not present."""
-    import urllib.request
+from src.config.utils import (
+    get_tts_model_path,
+    get_tts_quantized_model_path,
+    get_wake_word_model_dir,
+    get_wake_word_paths,
+)
+from src.util.audio_devices import query_devices
+
+# Parallel byte-range GETs for large Piper ONNX files (must be set before huggingface_hub import)
+os.environ.setdefault("HF_XET_HIGH_PERFORMANCE", "1")
+os.environ.setdefault("HF_XET_NUM_CONCURRENT_RANGE_GETS", "16")
+
+# Piper voices from https://github.com/rhasspy/piper/blob/master/VOICES.md
+PIPER_REPO_ID = "rhasspy/piper-voices"
+PIPER_REVISION = "v1.0.0"
+
+
+def _piper_repo_dir(model_name: str) -> str | None:
+    """Repo directory of a Piper voice, e.g. en_US-lessac-medium -> en/en_US/lessac/medium."""
+    parts = model_name.split("-")
+    if len(parts) != 3:
+        return None
+    locale, voice, quality = parts
+    return f"{locale.split('_')[0]}/{locale}/{voice}/{quality}"
+
+
+def _matches_hub_file(path: Path, info, verify: bool) -> bool:
+    """Compare a local file against hub metadata by size, and by hash when verify is set."""
+    if path.stat().st_size != info.size:
+        return False
+    if not verify:
+        return True
+    with open(path, "rb") as f:
+        if info.lfs is not None:
+            return hashlib.file_digest(f, "sha256").hexdigest() == info.lfs.sha256
+        # Small files are plain git blobs, identified by their git object id
+        digest = hashlib.sha1(f"blob {info.size}\0".encode())
+        digest.update(f.read())
+        return digest.hexdigest() == info.blob_id
+
+
+def _tts_model_intact(config: TTSConfig, model_path: Path, json_path: Path, verify: bool) -> bool:
+    """Check downloaded Piper files against the hub so truncated files get replaced."""
+    from huggingface_hub import HfApi
+
+    repo_dir = _piper_repo_dir(config.model_name)
+    if repo_dir is None:
+        return True
+
+    local_files = {
+        f"{repo_dir}/{config.model_name}.onnx": model_path,
+        f"{repo_dir}/{config.model_name}.onnx.json": json_path,
+    }
+    try:
+        infos = HfApi().get_paths_info(PIPER_REPO_ID, list(local_files), revision=PIPER_REVISION)
+    except Exception as e:
+        print(f"WARNING: Unable to fetch Piper model metadata, skipping integrity check: {e}")
+        return True
+
+    return all(_matches_hub_file(local_files[info.path], info, verify) for info in infos)
+
+
+def download_tts_model(config: TTSConfig, verify: bool = False):
+    """Download Piper TTS model if not present or incomplete."""
+    from huggingface_hub import snapshot_download
 
     model_path_str = get_tts_model_path(config)
     model_path = Path(model_path_str)
     json_path = Path(f"{model_path_str}.json")
 
-    # Extract model name from path (e.g., "models/tts/en_US-lessac-medium.onnx" -> "en_US-lessac-medium")
-    model_name = model_path.stem  # removes .onnx
+    if model_path.exists() and json_path.exists():
+        if _tts_model_intact(config, model_path, json_path, verify):
+            print(f"Piper model already exists: {model_path}")
+            return
+        print(f"Piper model at {model_path} is incomplete or corrupt, re-downloading...")
+        model_path.unlink()
+        json_path.unlink()
 
-    if config.model_name not in PIPER_MODELS:
-        print(f"Unknown Piper model: {model_name}. Skipping download.")
-        print(f"Available models: {list(PIPER_MODELS.keys())}")
-        return
+    # Voices live under <lang>/<locale>/<voice>/<quality>/, let the hub resolve the directory.
+    # The snapshot goes to a scratch dir next to the model, so the repo tree and the hub's
+    # .cache metadata are removed once the two files are moved out
+    print(f"Downloading Piper model: {config.model_name}...")
+    model_path.parent.mkdir(parents=True, exist_ok=True)
+    with tempfile.TemporaryDirectory(dir=model_path.parent) as download_dir:
+        local_dir = Path(
+            snapshot_download(
+                repo_id=PIPER_REPO_ID,
+                revision=PIPER_REVISION,
+                allow_patterns=[f"*/{config.model_name}.onnx", f"*/{config.model_name}.onnx.json"],
+                local_dir=download_dir,
+            )
+        )
 
-    urls = PIPER_MODELS[model_name]
+        # Flatten the repo layout into the configured model path
+        downloaded = {p.name: p for p in local_dir.rglob(f"{config.model_name}.onnx*")}
+        onnx_file = downloaded.get(f"{config.model_name}.onnx")
+        json_file = downloaded.get(f"{config.model_name}.onnx.json")
+        if onnx_file is None or json_file is None:
+            print(f"Unknown Piper model: {config.model_name}. Skipping download.")
+            print(f"See available voices at https://huggingface.co/{PIPER_REPO_ID}")
+            return
+
+        onnx_file.replace(model_path)
+        json_file.replace(json_path)
+    print(f"  Saved to {model_path}")
 
-    # Create directory if needed
-    model_path.parent.mkdir(parents=True, exist_ok=True)
 
-    # Download ONNX model
+def _quantize_onnx(model_path: Path, quantized_path: Path, label: str, **kwargs) -> None:
+    """Write a dynamically int8-quantized copy of an ONNX model, unless an up-to-date one exists."""
+    try:
+        from onnxruntime.quantization import QuantType, quantize_dynamic
+    except ImportError:
+        print(f"onnxruntime quantization tools not available. Skipping {label} quantization...")
+        return
+
     if not model_path.exists():
-        print(f"Downloading Piper model: {model_name}...")
-        urllib.request.urlretrieve(urls["onnx"], model_path)
-        print(f"  Saved to {model_path}")
-    else:
-        print(f"Piper model already exists: {model_path}")
+        print(f"WARNING: {label} model missing, cannot quantize: {model_path}")
+        return
+    # A re-downloaded model is newer than its stale quantized copy
+    if quantized_path.exists() and quantized_path.stat().st_mtime >= model_path.stat().st_mtime:
+        print(f"Quantized {label} model already exists: {quantized_path}")
+        return
 
-    # Download JSON config
-    if not json_path.exists():
-        print(f"Downloading Piper model config...")
-        urllib.request.urlretrieve(urls["json"], json_path)
-        print(f"  Saved to {json_path}")
-    else:
-        print(f"Piper config already exists: {json_path}")
+    print(f"Quantizing {label} model to int8: {quantized_path}")
+    quantize_dynamic(str(model_path), str(quantized_path), weight_type=QuantType.QInt8, **kwargs)
+
+
+def quantize_tts_model(config: TTSConfig):
+    """Write an int8 copy of the Piper model when tts.quantized is set."""
+    if config.quantized:
+        _quantize_onnx(
+            Path(get_tts_model_path(config)), Path(get_tts_quantized_model_path(config)), "Piper"
+        )
+
+
+def prepare_tts_model(config: TTSConfig, verify: bool = False):
+    download_tts_model(config, verify)
+    quantize_tts_model(config)
 
 
 def download_wake_word_model(config: WakeWordConfig):
@@ -84,6 +165,24 @@ def download_wake_word_model(config: WakeWordConfig):
         openwakeword.utils.download_models([config.model_name])
 
 
+def quantize_wake_word_embedding(config: WakeWordConfig):
+    """Write an int8 copy of the wake word embedding model when quantized_embedding is set."""
+    if not config.quantized_embedding or config.model_extension != "onnx":
+        return
+    paths = get_wake_word_paths(config)
+    _quantize_onnx(
+        Path(paths.embedding),
+        Path(paths.quantized_embedding),
+        "wake word embedding",
+        op_types_to_quantize=["MatMul"],
+    )
+
+
+def prepare_wake_word_model(config: WakeWordConfig):
+    download_wake_word_model(config)
+    quantize_wake_word_embedding(config)
+
+
 def verify_audio_device(device: str):
     try:
         import sounddevice as sd
@@ -92,13 +191,18 @@ def verify_audio_device(device: str):
         return
 
     if device is None:
-        default = sd.query_devices(kind="input")
+        default_index = sd.default.device[0]
+        if default_index is not None and default_index >= 0:
+            default = query_devices()[default_index]
+        else:
+            default = sd.query_devices(kind="input")
         print(f"No audio device configured. Default input: {default['name']}")
         return
 
-    devices = sd.query_devices()
+    matches = re.compile(re.escape(device), re.IGNORECASE).search
+    devices = query_devices()
     for i, dev in enumerate(devices):
-        if device.lower() in dev["name"].lower():
+        if matches(dev["name"]):
             print(f"Audio device found: [{i}] {dev['name']}")
             return
 
@@ -128,13 +232,39 @@ def pull_ollama_model(model: str):
         print("WARNING: ollama pull timed out after 5 minutes")
 
 
+def verify_audio_devices(config: AudioConfig):
+    # Sequential on purpose: both checks share one PortAudio enumeration
+    verify_audio_device(config.capture_device)
+    verify_audio_device(config.playback_device)
+
+
+async def setup_async(config: AppConfig, verify: bool = False) -> None:
+    """Run the independent setup steps concurrently, blocking work runs in threads."""
+    results = await asyncio.gather(
+        asyncio.to_thread(pull_ollama_model, config.agent.model),
+        asyncio.to_thread(prepare_wake_word_model, config.wake_word),
+        asyncio.to_thread(prepare_tts_model, config.tts, verify),
+        asyncio.to_thread(verify_audio_devices, config.audio),
+        return_exceptions=True,
+    )
+    errors = [r for r in results if isinstance(r, BaseException)]
+    for error in errors:
+        print(f"ERROR: Setup step failed: {error!r}")
+    if errors:
+        raise errors[0]
+
+
 def main() -> None:
+    parser = argparse.ArgumentParser(description="Voice assistant setup")
+    parser.add_argument(
+        "--verify",
+        action="store_true",
+        help="Hash-check downloaded models against the hub",
+    )
+    args = parser.parse_args()
+
     config, _ = load_config()
-    pull_ollama_model(config.agent.model)
-    download_wake_word_model(config.wake_word)
-    download_tts_model(config.tts)
-    verify_audio_device(config.audio.capture_device)
-    verify_audio_device(config.audio.playback_device)
+    asyncio.run(setup_async(config, args.verify))
 
 
 if __name__ == '__main__':
@@ -1,10 +1,12 @@
 # src/config/loader.py
+import hashlib
+import mmap
 import os
+import pickle
+from dataclasses import MISSING, Field, fields
 from pathlib import Path
 from typing import Any
 
-import yaml
-
 from src.config.schema import (
     AgentConfig,
     AppConfig,
@@ -18,16 +20,16 @@ from src.config.schema import (
 )
 from src.config.secrets import Secrets, load_secrets
 
-_SECTION_CLASSES = {
-    "wake_word": WakeWordConfig,
-    "sound_bytes": SoundBytesConfig,
-    "audio": AudioConfig,
-    "stt": STTConfig,
-    "agent": AgentConfig,
-    "tts": TTSConfig,
-    "session": SessionConfig,
-    "logging": LoggingConfig,
-}
+_SECTIONS: tuple[tuple[str, type], ...] = (
+    ("wake_word", WakeWordConfig),
+    ("sound_bytes", SoundBytesConfig),
+    ("audio", AudioConfig),
+    ("stt", STTConfig),
+    ("agent", AgentConfig),
+    ("tts", TTSConfig),
+    ("session", SessionConfig),
+    ("logging", LoggingConfig),
+)
 
 _ENV_OVERRIDES: dict[str, tuple[str, str]] = {
     "AGENT_SYSTEM_PROMPT": ("agent", "system_prompt"),
@@ -42,6 +44,72 @@ def _apply_env_overrides(data: dict[str, Any]) -> None:
             data.setdefault(section, {})[key] = value
 
 
+# The parsed AppConfig is pickled next to config.yaml and reused while the cache
+# key matches: config.yaml stat and content hash, mapped env overrides and the schema
+_CACHE_FILENAME = ".config.cache.pkl"
+
+
+def _field_default(f: Field) -> str:
+    """Stable repr of a field's default, factories are called for their value."""
+    if f.default_factory is not MISSING:
+        return repr(f.default_factory())
+    return "MISSING" if f.default is MISSING else repr(f.default)
+
+
+def _schema_fingerprint() -> tuple[Any, ...]:
+    """Name, type and default of every field, so any schema change invalidates stale pickles."""
+    return tuple(
+        (name, tuple((f.name, str(f.type), _field_default(f)) for f in fields(cls)))
+        for name, cls in _SECTIONS
+    )
+
+
+_SCHEMA_FINGERPRINT = _schema_fingerprint()
+
+
+def _parse_yaml(raw: mmap.mmap) -> dict[str, Any]:
+    """Parse YAML with the libyaml C loader when available. yaml is imported lazily."""
+    import yaml
+
+    try:
+        from yaml import CSafeLoader as Loader
+    except ImportError:
+        from yaml import SafeLoader as Loader
+
+    return yaml.load(raw, Loader=Loader) or {}
+
+
+def _cache_key(config_path: Path, raw: mmap.mmap) -> tuple[Any, ...]:
+    """Key the parsed config on file stat, content hash, env overrides and schema."""
+    stat = config_path.stat()
+    return (
+        stat.st_mtime_ns,
+        stat.st_size,
+        hashlib.blake2b(raw, digest_size=8).hexdigest(),
+        tuple(os.environ.get(k) for k in sorted(_ENV_OVERRIDES)),
+        _SCHEMA_FINGERPRINT,
+    )
+
+
+def _read_cache(cache_path: Path, key: tuple[Any, ...]) -> AppConfig | None:
+    """Return the cached AppConfig if its key matches, otherwise None."""
+    try:
+        with open(cache_path, "rb") as f:
+            cached_key, config = pickle.load(f)
+    except Exception:
+        return None
+    return config if cached_key == key else None
+
+
+def _write_cache(cache_path: Path, key: tuple[Any, ...], config: AppConfig) -> None:
+    """Best-effort write of the parsed AppConfig next to config.yaml."""
+    try:
+        with open(cache_path, "wb") as f:
+            pickle.dump((key, config), f, protocol=pickle.HIGHEST_PROTOCOL)
+    except OSError:
+        pass
+
+
 def load_config(
     config_path: Path = Path("config.yaml"),
     env_path: Path = Path(".env"),
@@ -50,18 +118,20 @@ def load_config(
     secrets = load_secrets(env_path)
 
     data: dict[str, Any] = {}
-    if config_path.exists():
-        with open(config_path) as f:
-            data = yaml.safe_load(f) or {}
+    cache_key: tuple[Any, ...] | None = None
+    cache_path = config_path.with_name(_CACHE_FILENAME)
+    if config_path.exists() and config_path.stat().st_size:
+        # Hash and parse straight from the mapped file, libyaml reads it without a copy
+        with open(config_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as raw:
+            cache_key = _cache_key(config_path, raw)
+            cached = _read_cache(cache_path, cache_key)
+            if cached is not None:
+                return cached, secrets
+            data = _parse_yaml(raw)
 
     _apply_env_overrides(data)
 
-    sections: dict[str, Any] = {}
-    for name, cls in _SECTION_CLASSES.items():
-        section_data = data.get(name, {})
-        if section_data:
-            sections[name] = cls(**section_data)
-        else:
-            sections[name] = cls()
-
-    return AppConfig(**sections), secrets
\ No newline at end of file
+    config = AppConfig(**{name: cls(**(data.get(name) or {})) for name, cls in _SECTIONS})
+    if cache_key is not None:
+        _write_cache(cache_path, cache_key, config)
+    return config, secrets
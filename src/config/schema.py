@@ -1,23 +1,27 @@
 from dataclasses import dataclass, field
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class WakeWordConfig:
     model_name: str = "hey_jarvis_v0.1"
     models_path: str = "models/wake_word/"
-    model_extension: str = "tflite"
+    model_extension: str = "onnx"  # Also selects the runtime: "onnx" (ONNX Runtime) or "tflite"
     threshold: float = 0.5
     vad_threshold: float | None = None
+    max_batch_frames: int = 4  # Backlogged frames scored per predict call, older ones are dropped
+    energy_gate: int = 100  # Frame RMS under which long quiet spells skip the model, 0 disables
+    # Use an int8 copy of the embedding model (onnx only), written by setup.py
+    quantized_embedding: bool = False
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SoundBytesConfig:
     init_byte: str = "Ready"
     greeting_bytes: list[str] = field(default_factory=list)
     thinking_bytes: list[str] = field(default_factory=list)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AudioConfig:
     sample_rate: int = 16000
     frame_duration_ms: int = 80
@@ -28,7 +32,7 @@ class AudioConfig:
     playback_volume: int = 0.5 # Between 0-1 (above 1 may cause distortion)
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class STTConfig:
     model_size: str = "base.en"
     device: str = "cpu"
@@ -38,7 +42,7 @@ class STTConfig:
     vad_filter: bool = True
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AgentConfig:
     model: str = "qwen2.5:1.5b"
     system_prompt: str | None = None
@@ -49,27 +53,32 @@ class AgentConfig:
     num_thread: int = 4
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class TTSConfig:
     model_name: str = "en_US-lessac-medium"
     models_path: str = "models/tts/en_US-lessac-medium"
     model_extension: str = "onnx"
     batch_min_chars: int = 50   # Don't speak until at least this many chars
     batch_max_chars: int = 200  # Force speak at this limit
+    batch_first_min_chars: int = 20  # Smaller first batch to cut time to first audio
+    max_concurrent_synthesis: int = 2  # Batches synthesized ahead of playback in parallel
+    max_pending_batches: int = 4  # Queued batches before the agent stream waits on playback
+    num_threads: int = 2  # ONNX Runtime threads per synthesis, 0 keeps the runtime default
+    quantized: bool = False  # Use an int8 copy of the voice, written by setup.py
     speaker_id: int = 0
     length_scale: float = 1.0
     noise_scale: float = 0.667
     noise_w: float = 0.8
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class SessionConfig:
     idle_timeout_seconds: float = 60.0
     max_history_messages: int = 50
     include_system_reminders: bool = True
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class LoggingConfig:
     level: str = "INFO"
     file: str = "logs/assistant.log"
@@ -77,7 +86,7 @@ class LoggingConfig:
     backup_count: int = 3
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class AppConfig:
     wake_word: WakeWordConfig = field(default_factory=WakeWordConfig)
     sound_bytes: SoundBytesConfig = field(default_factory=SoundBytesConfig)
@@ -19,4 +19,4 @@ def load_secrets(env_path: Path = Path(".env")) -> Secrets:
 
     return Secrets(
         brave_search_api_key=os.environ.get("BRAVE_SEARCH_API_KEY", ""),
-    )
\ No newline at end of file
+    )
@@ -1,21 +1,46 @@
+import functools
 import os
+from typing import NamedTuple
 
 from src.config.schema import TTSConfig, WakeWordConfig
 
+
+class WakeWordPaths(NamedTuple):
+    model_dir: str
+    model: str
+    melspec: str
+    embedding: str
+    quantized_embedding: str
+
+
+@functools.lru_cache(maxsize=8)
+def get_wake_word_paths(config: WakeWordConfig) -> WakeWordPaths:
+    """Resolve all wake word model paths once per (frozen, hashable) config."""
+    model_dir = os.path.join(config.models_path, config.model_name)
+    return WakeWordPaths(
+        model_dir=model_dir,
+        model=os.path.join(model_dir, config.model_name + "." + config.model_extension),
+        melspec=os.path.join(model_dir, "melspectrogram." + config.model_extension),
+        embedding=os.path.join(model_dir, "embedding_model." + config.model_extension),
+        quantized_embedding=os.path.join(
+            model_dir, "embedding_model.int8." + config.model_extension
+        ),
+    )
+
 def get_wake_word_model_dir(config: WakeWordConfig) -> str:
-    return os.path.join(config.models_path, config.model_name)
+    return get_wake_word_paths(config).model_dir
 
 def get_wake_word_model_path(config: WakeWordConfig) -> str:
-    model_dir = get_wake_word_model_dir(config)
-    return os.path.join(model_dir, config.model_name + "." + config.model_extension)
+    return get_wake_word_paths(config).model
 
 def get_wake_word_melspec_path(config: WakeWordConfig) -> str:
-    model_dir = get_wake_word_model_dir(config)
-    return os.path.join(model_dir, "melspectrogram." + config.model_extension)
+    return get_wake_word_paths(config).melspec
 
 def get_wake_word_embedding_path(config: WakeWordConfig) -> str:
-    model_dir = get_wake_word_model_dir(config)
-    return os.path.join(model_dir, "embedding_model." + config.model_extension)
+    return get_wake_word_paths(config).embedding
 
 def get_tts_model_path(config: TTSConfig) -> str:
     return os.path.join(config.models_path, config.model_name + "." + config.model_extension)
+
+def get_tts_quantized_model_path(config: TTSConfig) -> str:
+    return os.path.join(config.models_path, config.model_name + ".int8." + config.model_extension)
@@ -1,24 +1,38 @@
+from __future__ import annotations
+
 import asyncio
 import logging
 import random
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING
 
 import numpy as np
 
 from src.config.schema import AppConfig
 from src.core.session import Session
 from src.core.state import AssistantState, validate_transition
-from src.services.agent import AgentService
-from src.services.audio_capture import AudioCaptureService
-from src.services.audio_playback import AudioPlaybackService
-from src.services.stt import SpeechToTextService
-from src.services.tts import TextToSpeechService
-from src.services.wake_word import WakeWordDetector
 from src.core.signal_bus import SignalBus
 from src.util.chunk_batcher import ChunkBatcher
-from src.util.prompt_loader import PromptLoader
+
+if TYPE_CHECKING:
+    # Services are injected, importing them here would pull in their heavy dependencies
+    from src.services.agent import AgentService
+    from src.services.audio_capture import AudioCaptureService
+    from src.services.audio_playback import AudioPlaybackService
+    from src.services.stt import SpeechToTextService
+    from src.services.tts import TextToSpeechService
+    from src.services.wake_word import WakeWordDetector
 
 logger = logging.getLogger(__name__)
 
+def _discard(task: asyncio.Task[str]) -> None:
+    """Let an unused transcription finish on its own, consuming its result or error."""
+    task.add_done_callback(lambda t: t.cancelled() or t.exception())
+
+
+# A batch being synthesized and the queue its audio chunks stream through (None ends it)
+_SynthesisJob = tuple[asyncio.Task[None], asyncio.Queue[bytes | None]]
+
 
 class Orchestrator:
     """State machine orchestrating the voice assistant loop."""
@@ -50,13 +64,39 @@ class Orchestrator:
         self._running = False
         self._skip_greeting = False
         self._played_init = False
-        self._pending_chunks: asyncio.Queue[str | None] = asyncio.Queue()
 
         # Temporary data passed between states
         self._audio_buffer: np.ndarray | None = None
+        self._pending_transcription: asyncio.Task[str] | None = None
+        # Listening limits in frames, fixed for the lifetime of the config
+        frame_ms = config.audio.frame_duration_ms
+        self._max_listen_frames = 10_000 // frame_ms  # 10s max
+        # At least one frame each, frames longer than the pause would otherwise give 0
+        self._silence_frames_to_stop = max(1, 1_500 // frame_ms)  # 1.5s silence
+        # Start STT early after a 0.5s pause
+        self._silence_frames_to_speculate = max(1, 500 // frame_ms)
+        # rms <= threshold  <=>  sum(x^2) <= threshold^2 * n
+        self._silence_energy = config.audio.energy_threshold ** 2
+        # Squared samples of one frame, int16 squares fit in int32
+        frame_samples = config.audio.sample_rate * frame_ms // 1000 * config.audio.channels
+        self._energy_scratch = np.empty(frame_samples, dtype=np.int32)
+        # Reused capture buffer for one utterance (10s max), filled in place while listening.
+        # Held as normalized float32, the STT input format, so each frame is converted once
+        self._listen_buf = np.empty(int(10 * config.audio.sample_rate), dtype=np.float32)
         self._pending_text: str = ""
         self._pending_response: str = ""
 
+        # State handlers indexed by state value - 1, responses are spoken from within THINKING
+        handlers = {
+            AssistantState.WAITING: self._handle_waiting,
+            AssistantState.LISTENING: self._handle_listening,
+            AssistantState.TRANSCRIBING: self._handle_transcribing,
+            AssistantState.THINKING: self._handle_thinking,
+        }
+        self._handlers: tuple[Callable[[], Awaitable[None]] | None, ...] = tuple(
+            handlers.get(state) for state in AssistantState
+        )
+
     async def start(self) -> None:
         """Start all services and begin the main loop."""
         await self._wake_word.start()
@@ -66,10 +106,22 @@ class Orchestrator:
         await self._tts.start()
         await self._playback.start()
 
-        # Init sound bytes
-        self.init_byte = await self._tts.synthesize(self._config.sound_bytes.init_byte)
-        self.greeting_bytes = [await self._tts.synthesize(byte) for byte in self._config.sound_bytes.greeting_bytes]
-        self.thinking_bytes = [await self._tts.synthesize(byte) for byte in self._config.sound_bytes.thinking_bytes]
+        # Init sound bytes, synthesized concurrently (bounded like response synthesis)
+        sound_bytes = self._config.sound_bytes
+        synthesis_slots = asyncio.Semaphore(self._config.tts.max_concurrent_synthesis)
+
+        async def synthesize(text: str) -> bytes:
+            async with synthesis_slots:
+                return await self._tts.synthesize(text)
+
+        self.init_byte, *synthesized = await asyncio.gather(
+            synthesize(sound_bytes.init_byte),
+            *map(synthesize, sound_bytes.greeting_bytes),
+            *map(synthesize, sound_bytes.thinking_bytes),
+        )
+        num_greetings = len(sound_bytes.greeting_bytes)
+        self.greeting_bytes = synthesized[:num_greetings]
+        self.thinking_bytes = synthesized[num_greetings:]
 
         self._running = True
         logger.info("Orchestrator started")
@@ -85,12 +137,6 @@ class Orchestrator:
         await self._stt.stop()
         await self._audio_capture.stop()
         await self._wake_word.stop()
-        try:
-            import sounddevice as sd
-            sd._terminate()
-            sd._initialize()
-        except:
-            logger.warning("Unable to force PortAudio to release device")
         logger.info("Orchestrator stopped")
 
     def _transition_to(self, target: AssistantState) -> None:
@@ -101,17 +147,10 @@ class Orchestrator:
     async def _run_loop(self) -> None:
         while self._running:
             try:
-                match self._state:
-                    case AssistantState.WAITING:
-                        await self._handle_waiting()
-                    case AssistantState.LISTENING:
-                        await self._handle_listening()
-                    case AssistantState.TRANSCRIBING:
-                        await self._handle_transcribing()
-                    case AssistantState.THINKING:
-                        await self._handle_thinking()
-                    case AssistantState.SPEAKING:
-                        await self._handle_speaking()
+                handler = self._handlers[self._state.value - 1]
+                if handler is None:
+                    raise RuntimeError(f"No handler for state {self._state.name}")
+                await handler()
             except Exception:
                 logger.exception(f"Error in state {self._state.name}, resetting to WAITING")
                 self._state = AssistantState.WAITING
@@ -127,51 +166,86 @@ class Orchestrator:
         if not self._played_init:
             await self._playback.play(self.init_byte) # Signal ready for voice
             self._played_init = True
-        async for frame in self._audio_capture.stream_frames():
-            if not self._running:
-                break
-            if await self._wake_word.detect(frame):
-                self._transition_to(AssistantState.LISTENING)
-                break
+        # Frames go from the audio thread straight to the detection thread,
+        # the loop only wakes up once the wake word is heard
+        self._audio_capture.set_frame_sink(self._wake_word.feed)
+        try:
+            detected = await self._wake_word.wait_for_wake_word()
+        finally:
+            self._audio_capture.set_frame_sink(None)
         self._audio_capture.stop_capture()
+        if detected:
+            self._transition_to(AssistantState.LISTENING)
 
     async def _handle_listening(self) -> None:
         """Capture audio until silence or timeout."""
         logger.info("Listening for speech...")
-        frames: list[np.ndarray] = []
+        offset = 0
+        num_frames = 0
         silence_frames = 0
-        max_frames = int(10 * 1000 / self._config.audio.frame_duration_ms)  # 10s max
-        silence_threshold = int(1.5 * 1000 / self._config.audio.frame_duration_ms)  # 1.5s silence
         speech_detected = False
+        # Transcription started during a pause, kept if the speaker does not resume.
+        # A discarded one still occupies the STT worker until it finishes (cancelling
+        # the task does not stop Whisper), so no new one starts before then
+        speculative: asyncio.Task[str] | None = None
+        discarded: asyncio.Task[str] | None = None
 
         if not self._skip_greeting:
             await asyncio.sleep(0.3)
             await self._playback.play(random.choice(self.greeting_bytes))
         self._skip_greeting = False
 
-        # Reset wake word detector to clear any stale audio state
+        # Clear the wake word audio from the detector, a no-op if it scored nothing since
         await self._wake_word.reset()
         self._audio_capture.start_capture()
-        async for frame in self._audio_capture.stream_frames():
-            if not self._running:
-                return
-
-            frames.append(frame)
-
-            # Detect silence
-            if self._audio_capture.is_silent_frame(frame):
-                silence_frames += 1
-            else:
-                speech_detected = True
-                silence_frames = 0
-
-            # End on silence after speech
-            if speech_detected and silence_frames >= silence_threshold:
-                break
-
-            # Timeout with no speech
-            if len(frames) >= max_frames:
-                break
+        try:
+            async for frame in self._audio_capture.stream_frames():
+                if not self._running:
+                    if speculative is not None:
+                        speculative.cancel()
+                    return
+
+                n = min(frame.size, self._listen_buf.size - offset)
+                np.multiply(
+                    frame[:n], np.float32(1 / 32768), out=self._listen_buf[offset:offset + n]
+                )
+                offset += n
+                num_frames += 1
+
+                # Detect silence: count consecutive silent frames, reset on speech
+                if frame.size > self._energy_scratch.size:
+                    self._energy_scratch = np.empty(frame.size, dtype=np.int32)
+                squares = np.multiply(
+                    frame, frame, out=self._energy_scratch[:frame.size], dtype=np.int32
+                )
+                silent = int(squares.sum(dtype=np.int64)) <= self._silence_energy * frame.size
+                silence_frames = (silence_frames + 1) * silent
+                speech_detected |= not silent
+
+                # Overlap STT with the end-of-speech silence wait, set it aside if speech resumes
+                if not silent and speculative is not None:
+                    discarded, speculative = speculative, None
+                    _discard(discarded)
+                elif (
+                    speech_detected
+                    and silence_frames == self._silence_frames_to_speculate
+                    and (discarded is None or discarded.done())
+                ):
+                    speculative = asyncio.create_task(
+                        self._stt.transcribe(self._listen_buf[:offset])
+                    )
+
+                # End on silence after speech
+                if speech_detected and silence_frames >= self._silence_frames_to_stop:
+                    break
+
+                # Timeout with no speech
+                if num_frames >= self._max_listen_frames or offset >= self._listen_buf.size:
+                    break
+        except BaseException:
+            if speculative is not None:
+                speculative.cancel()
+            raise
         self._audio_capture.stop_capture()
 
         if not speech_detected:
@@ -179,7 +253,9 @@ class Orchestrator:
             self._transition_to(AssistantState.WAITING)
             return
 
-        self._audio_buffer = np.concatenate(frames)
+        # View into the reused buffer, consumed by transcription before the next listen
+        self._audio_buffer = self._listen_buf[:offset]
+        self._pending_transcription = speculative
         self._transition_to(AssistantState.TRANSCRIBING)
 
     async def _handle_transcribing(self) -> None:
@@ -191,7 +267,11 @@ class Orchestrator:
         logger.info("Transcribing speech input...")
         await self._playback.play(random.choice(self.thinking_bytes))
 
-        text = await self._stt.transcribe(self._audio_buffer)
+        speculative, self._pending_transcription = self._pending_transcription, None
+        if speculative is not None:
+            text = await speculative  # Started while the user was finishing speaking
+        else:
+            text = await self._stt.transcribe(self._audio_buffer)
         self._audio_buffer = None
 
         if not text or len(text) < 2:
@@ -205,41 +285,64 @@ class Orchestrator:
 
     async def _handle_thinking(self) -> None:
         """Run the agent loop and accumulate response."""
-        tool_registry = self._agent._tools
-        system_prompt = PromptLoader.load_system_prompt(self._config.agent, tool_registry)
         if not self._session.is_active:
-            self._session.start(system_prompt)
+            self._session.start(self._agent.system_prompt)
+
+        response_parts: list[str] = []
+
+        # Synthesis starts as soon as a batch is ready, playback consumes batches in order
+        # and plays each one chunk by chunk as it streams out of TTS.
+        # Bounded so a fast agent stream cannot run far ahead of playback
+        synthesis: asyncio.Queue[_SynthesisJob | None] = asyncio.Queue(
+            maxsize=self._config.tts.max_pending_batches
+        )
+        playback_task = asyncio.create_task(self._playback_worker(synthesis))
+
+        synthesis_slots = asyncio.Semaphore(self._config.tts.max_concurrent_synthesis)
+
+        async def synthesize(text: str, chunks: asyncio.Queue[bytes | None]) -> None:
+            try:
+                async with synthesis_slots:
+                    async for audio in self._tts.synthesize_stream(text):
+                        chunks.put_nowait(audio)
+            finally:
+                chunks.put_nowait(None)
+
+        async def speak(text: str) -> None:
+            chunks: asyncio.Queue[bytes | None] = asyncio.Queue()
+            await synthesis.put((asyncio.create_task(synthesize(text, chunks)), chunks))
 
-        response_text = ""
-        
-        audio_queue: asyncio.Queue[bytes | None] = asyncio.Queue()
-        playback_task = asyncio.create_task(self._playback_worker(audio_queue))
-        synthesis_task = asyncio.create_task(self._synthesis_worker(audio_queue))
-        
         batcher = ChunkBatcher(
             min_chars=self._config.tts.batch_min_chars,
             max_chars=self._config.tts.batch_max_chars,
+            first_min_chars=self._config.tts.batch_first_min_chars,
         )
-        
-        async for chunk in self._agent.run(self._pending_text, self._session):
-            response_text += chunk
-            
-            for batch in batcher.add(chunk):
-                await self._pending_chunks.put(batch)
-        
-        # Flush remaining text
-        remaining = batcher.flush()
-        if remaining:
-            await self._pending_chunks.put(remaining)
-        
-        # Signal end
-        await self._pending_chunks.put(None)
-        
-        await synthesis_task
-        await playback_task
+
+        try:
+            async for chunk in self._agent.run(self._pending_text, self._session):
+                response_parts.append(chunk)
+
+                for batch in batcher.add(chunk):
+                    await speak(batch)
+
+            # Flush remaining text
+            remaining = batcher.flush()
+            if remaining:
+                await speak(remaining)
+
+            # Signal end
+            await synthesis.put(None)
+            await playback_task
+        finally:
+            # No-ops unless the agent failed mid-stream, then queued syntheses are dropped too
+            playback_task.cancel()
+            while not synthesis.empty():
+                if (job := synthesis.get_nowait()) is not None:
+                    job[0].cancel()
 
         self._pending_text = ""
 
+        response_text = "".join(response_parts)
         if not response_text.strip():
             logger.warning("Agent returned empty response")
             self._transition_to(AssistantState.WAITING)
@@ -251,25 +354,23 @@ class Orchestrator:
         self._transition_to(AssistantState.WAITING)
 
 
-    async def _synthesis_worker(self, audio_queue: asyncio.Queue[bytes | None]) -> None:
-        """Synthesize text chunks and queue audio for playback."""
-        while True:
-            text_chunk = await self._pending_chunks.get()
-            if text_chunk is None:
-                # Signal playback worker to stop
-                await audio_queue.put(None)
-                return
-            
-            audio_bytes = await self._tts.synthesize(text_chunk)
-            if audio_bytes:
-                await audio_queue.put(audio_bytes)
-
-
-    async def _playback_worker(self, audio_queue: asyncio.Queue[bytes | None]) -> None:
-        """Play audio chunks as they become available."""
-        while True:
-            audio_bytes = await audio_queue.get()
-            if audio_bytes is None:
-                return
-            
-            await self._playback.play(audio_bytes)
+    async def _playback_worker(self, synthesis: asyncio.Queue[_SynthesisJob | None]) -> None:
+        """Play synthesized batches in order, each chunk as soon as it is ready."""
+        error: Exception | None = None
+        while (job := await synthesis.get()) is not None:
+            task, chunks = job
+            if error is not None:
+                # Keep draining so the bounded queue never blocks the producer
+                task.cancel()
+                continue
+            try:
+                while (audio_bytes := await chunks.get()) is not None:
+                    await self._playback.play(audio_bytes)
+                await task  # Surface synthesis errors
+            except asyncio.CancelledError:
+                task.cancel()
+                raise
+            except Exception as e:
+                error = e
+        if error is not None:
+            raise error
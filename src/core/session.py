@@ -1,5 +1,7 @@
 import logging
 import time
+from collections import deque
+from collections.abc import Iterable
 from dataclasses import dataclass, field
 from typing import Any
 
@@ -15,6 +17,18 @@ class Message:
     content: str
     tool_calls: list[dict[str, Any]] | None = None
     tool_name: str | None = None
+    _ollama_entry: dict[str, Any] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+
+    def to_ollama(self) -> dict[str, Any]:
+        """Ollama SDK format, built once since messages are not modified after being added."""
+        if self._ollama_entry is None:
+            entry: dict[str, Any] = {"role": self.role, "content": self.content}
+            if self.tool_calls:
+                entry["tool_calls"] = self.tool_calls
+            self._ollama_entry = entry
+        return self._ollama_entry
 
 
 class Session:
@@ -22,35 +36,37 @@ class Session:
 
     def __init__(self, config: SessionConfig) -> None:
         self._config = config
-        self._messages: list[Message] = []
+        # System prompt kept apart from the history, which drops its oldest
+        # message on append once full
+        self._system: Message | None = None
+        self._history: deque[Message] = deque(maxlen=config.max_history_messages)
         self._last_activity: float = 0.0
         self._active: bool = False
 
     def start(self, system_prompt: str) -> None:
         """Begin a new session with system prompt. Clears old history."""
-        self._messages = [Message(role="system", content=system_prompt)]
+        self._system = Message(role="system", content=system_prompt)
+        self._history = deque(maxlen=max(self._config.max_history_messages - 1, 0))
         self._last_activity = time.monotonic()
         self._active = True
 
     def add_message(self, message: Message) -> None:
         """Append message and update idle timer."""
-        if len(self._messages) == 1 and self._messages[0].role == "system" and message.role == "user":
-            reminders = PromptLoader.get_system_reminders()
-            message.content = "\n".join(reminders) + message.content
-            logger.info(f"Adding {len(reminders)} system reminder(s)")
-        self._messages.append(message)
+        self.add_messages((message,))
+
+    def add_messages(self, messages: Iterable[Message]) -> None:
+        """Append messages in order and update idle timer once."""
+        for message in messages:
+            if self._system is not None and not self._history and message.role == "user":
+                reminders = PromptLoader.get_system_reminders()
+                message.content = "\n".join(reminders) + message.content
+                logger.info(f"Adding {len(reminders)} system reminder(s)")
+            self._history.append(message)
         self._last_activity = time.monotonic()
-        self._trim_history()
 
     def get_ollama_messages(self) -> list[dict[str, Any]]:
         """Convert messages to Ollama SDK format."""
-        result: list[dict[str, Any]] = []
-        for msg in self._messages:
-            entry: dict[str, Any] = {"role": msg.role, "content": msg.content}
-            if msg.tool_calls:
-                entry["tool_calls"] = msg.tool_calls
-            result.append(entry)
-        return result
+        return [msg.to_ollama() for msg in self.messages]
 
     @property
     def is_active(self) -> bool:
@@ -73,15 +89,7 @@ class Session:
 
     @property
     def messages(self) -> list[Message]:
-        return list(self._messages)
-
-    def _trim_history(self) -> None:
-        """Keep system prompt + last N messages if over limit."""
-        max_msgs = self._config.max_history_messages
-        if len(self._messages) <= max_msgs:
-            return
-        system = self._messages[0] if self._messages and self._messages[0].role == "system" else None
-        if system:
-            self._messages = [system] + self._messages[-(max_msgs - 1):]
-        else:
-            self._messages = self._messages[-max_msgs:]
+        """System prompt + the last N messages."""
+        if self._system is None:
+            return list(self._history)
+        return [self._system, *self._history]
@@ -1,16 +1,28 @@
+from enum import IntEnum
 from typing import Any
 
 
+class Signals(IntEnum):
+    """Known signals, each owning one slot on the bus."""
+
+    SKIP_GREETING = 0
+    END_SESSION = 1
+
+
 class SignalBus:
     """Simple signal bus for decoupled communication between tools and the orchestrator."""
 
+    __slots__ = ("_slots",)
+
     def __init__(self) -> None:
-        self._signals: dict[str, Any] = {}
+        # Fixed array indexed by signal, no string hashing on emit/poll
+        self._slots: list[Any | None] = [None] * len(Signals)
 
-    def emit(self, name: str, value: Any = True) -> None:
+    def emit(self, signal: Signals, value: Any = True) -> None:
         """Emit a signal with an optional value."""
-        self._signals[name] = value
+        self._slots[signal] = value
 
-    def poll(self, name: str) -> Any | None:
+    def poll(self, signal: Signals) -> Any | None:
         """Check and consume a signal. Returns None if not set."""
-        return self._signals.pop(name, None)
+        value, self._slots[signal] = self._slots[signal], None
+        return value
@@ -6,20 +6,28 @@ class AssistantState(Enum):
     LISTENING = auto()
     TRANSCRIBING = auto()
     THINKING = auto()
+    SPEAKING = auto()
 
 
 TRANSITIONS: dict[AssistantState, set[AssistantState]] = {
     AssistantState.WAITING: {AssistantState.LISTENING},
     AssistantState.LISTENING: {AssistantState.TRANSCRIBING, AssistantState.WAITING},
     AssistantState.TRANSCRIBING: {AssistantState.THINKING, AssistantState.WAITING},
-    AssistantState.THINKING: {AssistantState.LISTENING, AssistantState.WAITING},
+    AssistantState.THINKING: {AssistantState.SPEAKING, AssistantState.WAITING},
+    AssistantState.SPEAKING: {AssistantState.LISTENING, AssistantState.WAITING},
 }
 
+# Bit n of _ALLOWED_MASK[s.value] is set when s -> the state with value n is allowed
+_ALLOWED_MASK = [0] * (max(s.value for s in AssistantState) + 1)
+for _source, _targets in TRANSITIONS.items():
+    for _target in _targets:
+        _ALLOWED_MASK[_source.value] |= 1 << _target.value
+
 
 def validate_transition(current: AssistantState, target: AssistantState) -> None:
     """Raise ValueError if the transition is not allowed."""
-    allowed = TRANSITIONS.get(current, set())
-    if target not in allowed:
+    if not (_ALLOWED_MASK[current.value] >> target.value) & 1:
+        allowed = TRANSITIONS.get(current, set())
         raise ValueError(
             f"Invalid transition: {current.name} -> {target.name}. "
             f"Allowed: {[s.name for s in allowed]}"
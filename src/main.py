@@ -18,6 +18,7 @@ from src.tools.builtin.device_control import DeviceControlTool
 from src.tools.builtin.web_fetch import WebFetchTool
 from src.tools.builtin.web_search import WebSearchTool
 from src.tools.registry import ToolRegistry
+from src.util.http_client import create_http_client
 from src.util.logging import setup_logging
 from src.util.prompt_loader import PromptLoader
 
@@ -33,13 +34,14 @@ async def main(args) -> None:
     # Signal bus + tool registry
     signal_bus = SignalBus()
     registry = ToolRegistry()
+    http_client = create_http_client()  # Shared by the web tools, closed on exit
     if not args.no_tools:
         #registry.register(DeviceControlTool())
-        registry.register(WebFetchTool())
-        registry.register(WebSearchTool(secrets.brave_search_api_key))
+        registry.register(WebFetchTool(http_client))
+        registry.register(WebSearchTool(secrets.brave_search_api_key, http_client))
 
     system_prompt = PromptLoader.load_system_prompt(config.agent, registry)
-    logger.info(f"Loaded agent with system prompt:\n{system_prompt}")
+    logger.debug(f"Loaded agent with system prompt:\n{system_prompt}")
 
     # Exit early for print mode
     if args.print:
@@ -51,6 +53,7 @@ async def main(args) -> None:
         async for chunk in agent.run(args.print, session):
             print(chunk, end="", flush=True)
         await agent.stop()
+        await http_client.aclose()
         return
 
     # Services
@@ -95,6 +98,7 @@ async def main(args) -> None:
         logger.exception("Fatal error")
     finally:
         await orchestrator.stop()
+        await http_client.aclose()
 
 
 if __name__ == "__main__":
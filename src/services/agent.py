@@ -1,15 +1,18 @@
+import asyncio
 import logging
 import time
 from collections.abc import AsyncIterator
-from typing import Any
-
-from ollama import AsyncClient
+from typing import TYPE_CHECKING, Any
 
 from src.config.schema import AgentConfig
 from src.core.session import Message, Session
 from src.tools.registry import ToolRegistry
 from src.util.prompt_loader import PromptLoader
 
+if TYPE_CHECKING:
+    # ollama pulls in httpx and pydantic, imported when the agent starts
+    from ollama import AsyncClient
+
 logger = logging.getLogger(__name__)
 
 
@@ -24,8 +27,28 @@ class AgentService:
         self._config = config
         self._tools = tool_registry
         self._client: AsyncClient | None = None
+        # System prompt and tool schema are invariant until the registry changes
+        self._system_prompt = ""
+        self._ollama_tools: list[dict[str, Any]] | None = None
+        self._tools_version: int | None = None
+
+    @property
+    def system_prompt(self) -> str:
+        self._refresh_prompt_cache()
+        return self._system_prompt
+
+    def _refresh_prompt_cache(self) -> None:
+        """Rebuild the cached system prompt and tool schema if tools were registered since."""
+        if self._tools_version == self._tools.version:
+            return
+        self._system_prompt = PromptLoader.load_system_prompt(self._config, self._tools)
+        self._ollama_tools = self._tools.to_ollama_tools() or None
+        self._tools_version = self._tools.version
 
     async def start(self) -> None:
+        from ollama import AsyncClient
+
+        self._refresh_prompt_cache()
         self._client = AsyncClient()
         logger.info(f"Agent initialized with model: {self._config.model}")
         await self._warmup()
@@ -37,17 +60,16 @@ class AgentService:
             return
             
         logger.info(f"Warming up model: {self._config.model}")
-        system_prompt = PromptLoader.load_system_prompt(self._config, self._tools)
+        self._refresh_prompt_cache()
         start = time.monotonic()
         try:
-            ollama_tools = self._tools.to_ollama_tools() or None
             await self._client.chat(
                 model=self._config.model,
                 messages=[
-                    {"role": "system", "content": system_prompt},
+                    {"role": "system", "content": self._system_prompt},
                     {"role": "user", "content": "hi"},
                 ],
-                tools=ollama_tools,
+                tools=self._ollama_tools,
                 options={
                     "num_predict": 1,
                     "num_ctx": self._config.num_ctx,  # Match actual config
@@ -75,10 +97,11 @@ class AgentService:
 
         session.add_message(Message(role="user", content=user_text))
 
-        ollama_tools = self._tools.to_ollama_tools() or None
+        self._refresh_prompt_cache()
+        ollama_tools = self._ollama_tools
 
         for tool_round in range(self._config.max_tool_rounds + 1):
-            full_text = ""
+            text_parts: list[str] = []
             tool_calls: list[dict[str, Any]] = []
 
             try:
@@ -99,9 +122,10 @@ class AgentService:
             async for chunk in stream:
                 if elapsed is None:
                     elapsed = time.monotonic() - start
-                if chunk["message"]["content"]:
-                    full_text += chunk["message"]["content"]
-                    yield chunk["message"]["content"]
+                content = chunk["message"]["content"]
+                if content:
+                    text_parts.append(content)
+                    yield content
 
                 if chunk["message"].get("tool_calls"):
                     for tc in chunk["message"]["tool_calls"]:
@@ -112,7 +136,7 @@ class AgentService:
             # Record assistant message
             session.add_message(Message(
                 role="assistant",
-                content=full_text,
+                content="".join(text_parts),
                 tool_calls=tool_calls if tool_calls else None,
             ))
 
@@ -122,11 +146,12 @@ class AgentService:
 
             # Execute tool calls and feed results back
             logger.info(f"Tool round {tool_round + 1}: {len(tool_calls)} call(s)")
-            for tc in tool_calls:
-                fn = tc["function"]
-                result = await self._tools.call_tool(fn["name"], fn["arguments"])
-                session.add_message(Message(
-                    role="tool",
-                    content=result,
-                    tool_name=fn["name"],
-                ))
\ No newline at end of file
+            # Calls within a round are independent, run them concurrently and record in order
+            functions = [tc["function"] for tc in tool_calls]
+            results = await asyncio.gather(
+                *(self._tools.call_tool(fn["name"], fn["arguments"]) for fn in functions)
+            )
+            session.add_messages(
+                Message(role="tool", content=result, tool_name=fn["name"])
+                for fn, result in zip(functions, results)
+            )
\ No newline at end of file
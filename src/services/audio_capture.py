@@ -1,28 +1,39 @@
 import asyncio
 import logging
-from collections.abc import AsyncIterator
+from collections.abc import AsyncIterator, Callable
 from typing import Protocol
 
 import numpy as np
 
 from src.config.schema import AudioConfig
+from src.util.audio_devices import query_devices
 
 logger = logging.getLogger(__name__)
 
+# Capture ring size in frames, a power of two (~10s of 80ms frames)
+_RING_FRAMES = 128
+_RING_MASK = _RING_FRAMES - 1
+
 
 class AudioCaptureService(Protocol):
     async def start(self) -> None: ...
     async def stop(self) -> None: ...
     def stream_frames(self) -> AsyncIterator[np.ndarray]: ...
+    def set_frame_sink(self, sink: Callable[[np.ndarray], None] | None) -> None: ...
 
 
 class MockAudioCaptureService:
-    """Mock audio capture that yields silent frames at real-time rate."""
+    """Mock audio capture that yields silent frames at real-time rate. Frames are read-only."""
 
     def __init__(self, config: AudioConfig) -> None:
         self._config = config
         self._running = False
         self._frame_size = int(config.sample_rate * config.frame_duration_ms / 1000)
+        self._sleep_s = config.frame_duration_ms / 1000.0
+        # Shared read-only silence, yielded for every frame instead of a fresh allocation
+        self._silent_frame = np.zeros(self._frame_size, dtype=np.int16)
+        self._silent_frame.setflags(write=False)
+        self._sink_task: asyncio.Task[None] | None = None
 
     async def start(self) -> None:
         logger.info("MockAudioCapture started (silent frames)")
@@ -34,8 +45,19 @@ class MockAudioCaptureService:
 
     async def stream_frames(self) -> AsyncIterator[np.ndarray]:
         while self._running:
-            yield np.zeros(self._frame_size, dtype=np.int16)
-            await asyncio.sleep(self._config.frame_duration_ms / 1000.0)
+            yield self._silent_frame
+            await asyncio.sleep(self._sleep_s)
+
+    def set_frame_sink(self, sink: Callable[[np.ndarray], None] | None) -> None:
+        if self._sink_task is not None:
+            self._sink_task.cancel()
+            self._sink_task = None
+        if sink is not None:
+            self._sink_task = asyncio.create_task(self._feed_sink(sink))
+
+    async def _feed_sink(self, sink: Callable[[np.ndarray], None]) -> None:
+        async for frame in self.stream_frames():
+            sink(frame)
 
 
 class LiveAudioCaptureService:
@@ -46,28 +68,53 @@ class LiveAudioCaptureService:
         self._running = False
         self._frame_size = int(config.sample_rate * config.frame_duration_ms / 1000)
         self._stream: object | None = None
-        self._queue: asyncio.Queue[np.ndarray | None] = asyncio.Queue(maxsize=128)
+        # SPSC ring: the audio thread writes slots and advances _head, the consumer
+        # advances _tail. Both only grow, so head - tail is the number of queued frames
+        self._ring = np.zeros((_RING_FRAMES, self._frame_size * config.channels), dtype=np.int16)
+        # Byte views of each slot, the callback copies indata straight in without numpy wrapping
+        self._ring_slots = [memoryview(row).cast("B") for row in self._ring]
+        self._head = 0
+        self._tail = 0
+        self._frame_ready = asyncio.Event()
+        self._consumer_waiting = False
         self._loop: asyncio.AbstractEventLoop | None = None
+        self._frame_sink: Callable[[np.ndarray], None] | None = None
 
     async def start(self) -> None:
         import sounddevice as sd
 
         self._loop = asyncio.get_event_loop()
-        device = self._resolve_device(sd)
+        device = self._resolve_device()
 
         def _audio_callback(
             indata: bytes, frames: int, time_info: object, status: object
         ) -> None:
+            # The stream stays open between captures, frames are only kept while capturing
+            if not self._running:
+                return
             if status:
                 # Schedule warning on the event loop instead of logging directly
                 self._loop.call_soon_threadsafe(
                     lambda: logger.warning("Audio capture status: %s", status)
                 )
-            frame = np.frombuffer(indata, dtype=np.int16).copy()
-            try:
-                self._queue.put_nowait(frame)
-            except asyncio.QueueFull:
-                pass # Drop the frame
+            head = self._head
+            slot = head & _RING_MASK
+            sink = self._frame_sink
+            if sink is not None:
+                # The sink keeps up in real time, its slot is only reused a full ring later
+                self._ring_slots[slot][:] = indata
+                self._head = head + 1
+                sink(self._ring[slot])
+                return
+
+            if head - self._tail >= _RING_FRAMES:
+                return  # Consumer is a full ring behind, drop the frame
+            self._ring_slots[slot][:] = indata
+            self._head = head + 1
+            # Only cross into the event loop when the consumer is actually waiting
+            if self._consumer_waiting:
+                self._consumer_waiting = False
+                self._loop.call_soon_threadsafe(self._frame_ready.set)
 
         try:
             self._stream = sd.RawInputStream(
@@ -78,6 +125,8 @@ class LiveAudioCaptureService:
                 dtype="int16",
                 callback=_audio_callback,
             )
+            # Opened and started once, start_capture/stop_capture only gate the callback
+            self._stream.start()
             logger.info(
                 "LiveAudioCapture started (device=%s, rate=%d, frame_size=%d)",
                 device,
@@ -97,35 +146,44 @@ class LiveAudioCaptureService:
             self._stream.stop()
             self._stream.close()
             self._stream = None
-        # Signal consumer to exit
-        try:
-            self._queue.put_nowait(None)
-        except asyncio.QueueFull:
-            pass
+        # Wake the consumer so it sees _running is off
+        self._frame_ready.set()
         logger.info("LiveAudioCapture stopped")
 
     async def stream_frames(self) -> AsyncIterator[np.ndarray]:
+        """
+        Yield captured frames as views into the ring. A frame stays valid until the
+        next one is requested, copy it to keep it longer.
+        """
         if not self._running:
             logger.warning("Cannot stream audio capture frames, stream must be started first")
             return
         while self._running:
-            try:
-                # Use wait_for to not block on audio callback hogging async loop
-                frame = await asyncio.wait_for(self._queue.get(), timeout=0.1)
-                if frame is None:
-                    return
-                yield frame
-            except asyncio.TimeoutError:
-                # Just loop back and check _running again
+            if self._tail == self._head:
+                self._frame_ready.clear()
+                self._consumer_waiting = True
+                # Re-check after publishing the flag so a frame written in between is not missed
+                if self._tail == self._head:
+                    await self._frame_ready.wait()
+                self._consumer_waiting = False
                 continue
+            yield self._ring[self._tail & _RING_MASK]
+            self._tail += 1
+
+    def set_frame_sink(self, sink: Callable[[np.ndarray], None] | None) -> None:
+        """
+        Hand captured frames straight to sink on the audio thread instead of queueing
+        them for stream_frames. Frames are ring views, reused a full ring (~10s) later.
+        Pass None to go back to queueing.
+        """
+        self._frame_sink = sink
 
     def start_capture(self) -> None:
         if self._stream is None:
             logger.warning("Audio input stream is None")
             return
-        # Empty the queue
-        self._drain_queue()
-        self._stream.start()
+        # Skip frames left over from the previous capture
+        self._tail = self._head
         self._running = True
         logger.info("Audio capture started")
 
@@ -134,27 +192,20 @@ class LiveAudioCaptureService:
             logger.warning("Audio input stream is None")
             return
         self._running = False
-        self._stream.stop()
-        self._drain_queue()
+        self._tail = self._head
+        self._frame_ready.set()
         logger.info("Audio capture stopped")
 
-    def _drain_queue(self) -> None:
-        """Empty the queue without blocking."""
-        while True:
-            try:
-                self._queue.get_nowait()
-            except asyncio.QueueEmpty:
-                break
-
-    def _resolve_device(self, sd: object) -> int | None:
+    def _resolve_device(self) -> int | None:
         """Resolve config device string to a sounddevice device index."""
         device_str = self._config.capture_device
         if device_str is None:
             return None
 
-        devices = sd.query_devices()
+        needle = device_str.lower()
+        devices = query_devices()
         for i, dev in enumerate(devices):
-            if device_str.lower() in dev["name"].lower():
+            if needle in dev["name"].lower():
                 logger.info("Matched audio device: [%d] %s", i, dev["name"])
                 return i
 
@@ -162,8 +213,3 @@ class LiveAudioCaptureService:
         raise RuntimeError(
             f"Audio device not found: {device_str!r}. Available devices: {available}"
         )
-
-    def is_silent_frame(self, frame: np.ndarray) -> bool:
-        energy_threshold = self._config.energy_threshold
-        rms = np.sqrt(np.mean(frame.astype(np.float32) ** 2))
-        return rms <= energy_threshold
\ No newline at end of file
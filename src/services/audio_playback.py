@@ -5,6 +5,7 @@ from typing import Protocol
 import numpy as np
 
 from src.config.schema import AudioConfig
+from src.util.audio_devices import query_devices
 
 logger = logging.getLogger(__name__)
 
@@ -47,12 +48,22 @@ class LiveAudioPlaybackService:
         self._device: int | None = None
         self._playback_sample_rate: int = 22050  # Piper fixed output rate
         self._volume = config.playback_volume
+        self._stream: object | None = None
 
     async def start(self) -> None:
         import sounddevice as sd
 
         self._loop = asyncio.get_running_loop()
-        self._device = self._resolve_device(sd)
+        self._device = self._resolve_device()
+
+        # One long-lived output stream instead of opening the device per utterance
+        self._stream = sd.RawOutputStream(
+            samplerate=self._playback_sample_rate,
+            device=self._device,
+            channels=1,
+            dtype="int16",
+        )
+        self._stream.start()
 
         logger.info(
             "LiveAudioPlayback started (device=%s, rate=%d)",
@@ -61,7 +72,10 @@ class LiveAudioPlaybackService:
         )
 
     async def stop(self) -> None:
-        # No persistent stream to close (using sd.play)
+        if self._stream is not None:
+            self._stream.stop()
+            self._stream.close()
+            self._stream = None
         logger.info("LiveAudioPlayback stopped")
 
     async def play(self, audio_data: bytes) -> None:
@@ -73,35 +87,21 @@ class LiveAudioPlaybackService:
         if not audio_data:
             return
 
-        if self._loop is None:
+        if self._loop is None or self._stream is None:
             raise RuntimeError("Playback service must be started before calling play()")
 
-        import sounddevice as sd
-
-        # Convert bytes → int16 numpy array
-        audio = np.frombuffer(audio_data, dtype=np.int16)
-
-        # Convert to float32 in range [-1.0, 1.0]
-        audio_float = audio.astype(np.float32) / 32768.0
-
-        # Apply volume scaling
-        audio_float *= self._volume
+        if self._volume == 1.0:
+            audio_scaled = audio_data  # Raw stream takes the PCM bytes as they are
+        else:
+            # Scale in the int16 domain with one float32 pass, only a boost can clip
+            audio = np.frombuffer(audio_data, dtype=np.int16)
+            scaled = np.multiply(audio, np.float32(self._volume), dtype=np.float32)
+            if self._volume > 1.0:
+                np.clip(scaled, -32768.0, 32767.0, out=scaled)
+            audio_scaled = scaled.astype(np.int16)
 
-        # Clip to prevent overflow distortion
-        np.clip(audio_float, -1.0, 1.0, out=audio_float)
-
-        # Convert back to int16
-        audio_scaled = (audio_float * 32768.0).astype(np.int16)
-
-        def _play_blocking():
-            sd.play(
-                audio_scaled,
-                samplerate=self._playback_sample_rate,
-                device=self._device,
-            )
-            sd.wait()
-
-        await self._loop.run_in_executor(None, _play_blocking)
+        # Blocking write returns once the audio has been handed to PortAudio
+        await self._loop.run_in_executor(None, self._stream.write, audio_scaled)
 
     
     async def play_file(self, path: str, volume: float = 1.0) -> None:
@@ -118,27 +118,31 @@ class LiveAudioPlaybackService:
             sample_rate = wav.getframerate()
             frames = wav.readframes(wav.getnframes())
         
-        audio = np.frombuffer(frames, dtype=np.int16).astype(np.float32)
+        audio = np.frombuffer(frames, dtype=np.int16)
         
-        # Convert stereo to mono if needed
+        # Convert stereo to mono if needed, averaging in int32 with no float pass
         if channels == 2:
-            audio = audio.reshape(-1, 2).mean(axis=1)
+            stereo = audio.reshape(-1, 2)
+            audio = ((stereo[:, 0].astype(np.int32) + stereo[:, 1]) >> 1).astype(np.int16)
         
-        # Apply volume scaling
+        # Apply volume scaling, capped at 1.0 so the result always fits int16 without clipping
         volume *= self._volume
         volume = max(0.0, min(1.0, volume))
-        audio = audio * volume
-        
-        audio = np.clip(audio, -32768, 32767).astype(np.int16)
+        if volume != 1.0:
+            audio = np.multiply(audio, np.float32(volume), dtype=np.float32).astype(np.int16)
         
         loop = asyncio.get_event_loop()
+        if self._stream is not None and sample_rate == self._playback_sample_rate:
+            # Same format as TTS output, reuse the open stream
+            await loop.run_in_executor(None, self._stream.write, audio)
+            return
         await loop.run_in_executor(
             None,
             lambda: sd.play(audio, samplerate=sample_rate, blocking=True)
         )
 
 
-    def _resolve_device(self, sd: object) -> int | None:
+    def _resolve_device(self) -> int | None:
         """
         Resolve config device string to a sounddevice output device index.
         Matches by substring, same logic as capture service.
@@ -147,10 +151,11 @@ class LiveAudioPlaybackService:
         if device_str is None:
             return None
 
-        devices = sd.query_devices()
+        needle = device_str.lower()
+        devices = query_devices()
         for i, dev in enumerate(devices):
             # Ensure device supports output
-            if dev["max_output_channels"] > 0 and device_str.lower() in dev["name"].lower():
+            if dev["max_output_channels"] > 0 and needle in dev["name"].lower():
                 logger.info("Matched output audio device: [%d] %s", i, dev["name"])
                 return i
 
@@ -1,5 +1,8 @@
 import asyncio
 import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 
 import numpy as np
 
@@ -18,13 +21,19 @@ class SpeechToTextService:
     def __init__(self, config: STTConfig) -> None:
         self._config = config
         self._model: object | None = None
+        # Reused float32 input buffer, grown on demand; the lock covers speculative overlap
+        self._f32_scratch = np.empty(0, dtype=np.float32)
+        self._scratch_lock = threading.Lock()
+        # Own worker thread, so inference never queues behind other services in the default pool
+        self._executor: ThreadPoolExecutor | None = None
 
     async def start(self) -> None:
         from faster_whisper import WhisperModel
 
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="stt")
         loop = asyncio.get_event_loop()
         self._model = await loop.run_in_executor(
-            None,
+            self._executor,
             lambda: WhisperModel(
                 self._config.model_size,
                 device=self._config.device,
@@ -32,35 +41,63 @@ class SpeechToTextService:
             ),
         )
         logger.info(f"STT model loaded: {self._config.model_size}")
+        await self._warmup()
+
+    async def _warmup(self) -> None:
+        """Transcribe a second of silence so the first utterance does not pay for model init."""
+        def _run() -> None:
+            segments, _info = self._model.transcribe(  # type: ignore[union-attr]
+                np.zeros(16000, dtype=np.float32),
+                beam_size=self._config.beam_size,
+                language=self._config.language,
+                vad_filter=False,  # VAD would drop the silence and skip the encoder
+            )
+            for _ in segments:
+                pass
+
+        start = time.monotonic()
+        try:
+            await asyncio.get_running_loop().run_in_executor(self._executor, _run)
+            logger.info(f"STT warmup completed in {time.monotonic() - start:.1f}s")
+        except Exception:
+            logger.warning("STT warmup failed", exc_info=True)
 
     async def stop(self) -> None:
         self._model = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
         logger.info("STT model unloaded")
 
     async def transcribe(self, audio: np.ndarray) -> str:
-        """Transcribe int16 PCM audio to text."""
+        """Transcribe int16 PCM audio, or float32 audio already in [-1.0, 1.0], to text."""
         if self._model is None:
             raise TranscriptionError("STT model not loaded")
 
-        # faster-whisper expects float32 normalized to [-1.0, 1.0]
-        audio_float = audio.astype(np.float32) / 32768.0
-
-        loop = asyncio.get_event_loop()
-        try:
-            segments, _info = await loop.run_in_executor(
-                None,
-                lambda: self._model.transcribe(  # type: ignore[union-attr]
+        def _transcribe() -> str:
+            with self._scratch_lock:
+                if audio.dtype == np.float32:
+                    audio_float = audio
+                else:
+                    if self._f32_scratch.size < audio.size:
+                        self._f32_scratch = np.empty(audio.size, dtype=np.float32)
+                    # faster-whisper expects float32 normalized to [-1.0, 1.0], convert in one pass
+                    audio_float = np.multiply(
+                        audio, np.float32(1 / 32768), out=self._f32_scratch[:audio.size]
+                    )
+                # Features are extracted before this returns, the scratch is free afterwards
+                segments, _info = self._model.transcribe(  # type: ignore[union-attr]
                     audio_float,
                     beam_size=self._config.beam_size,
                     language=self._config.language,
                     vad_filter=self._config.vad_filter,
-                ),
-            )
-            # Segments is a generator - consume it in executor too
-            text = await loop.run_in_executor(
-                None,
-                lambda: " ".join(seg.text.strip() for seg in segments),
-            )
+                )
+            # Segments is a generator that decodes lazily, drive it on the same thread
+            return " ".join(seg.text.strip() for seg in segments)
+
+        try:
+            # Keep CPU-bound inference off the event loop so playback keeps streaming
+            text = await asyncio.get_running_loop().run_in_executor(self._executor, _transcribe)
         except Exception as e:
             raise TranscriptionError(f"Transcription failed: {e}") from e
 
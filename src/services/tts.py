@@ -1,12 +1,14 @@
 import asyncio
-import io
+import json
 import logging
+import os
 import shutil
 import subprocess
-import wave
+from collections.abc import AsyncIterator
+from concurrent.futures import ThreadPoolExecutor
 
 from src.config.schema import TTSConfig
-from src.config.utils import get_tts_model_path
+from src.config.utils import get_tts_model_path, get_tts_quantized_model_path
 
 logger = logging.getLogger(__name__)
 
@@ -20,20 +22,27 @@ class TextToSpeechService:
 
     def __init__(self, config: TTSConfig) -> None:
         self._config = config
+        self._model_path = get_tts_model_path(config)
         self._voice: object | None = None
         self._use_cli: bool = False
+        # Own workers, one per concurrent synthesis, instead of the shared default pool
+        self._executor: ThreadPoolExecutor | None = None
 
     async def start(self) -> None:
         try:
             from piper.voice import PiperVoice
 
             loop = asyncio.get_running_loop()
+            self._executor = ThreadPoolExecutor(
+                max_workers=max(self._config.max_concurrent_synthesis, 1),
+                thread_name_prefix="tts",
+            )
 
             self._voice = await loop.run_in_executor(
-                None,
-                lambda: PiperVoice.load(get_tts_model_path(self._config)),
+                self._executor,
+                lambda: self._load_voice(PiperVoice),
             )
-            logger.info(f"Piper voice loaded (Python): {get_tts_model_path(self._config)}")
+            logger.info(f"Piper voice loaded (Python): {self._model_path}")
         except (ImportError, Exception) as e:
             logger.warning(f"piper-tts Python package failed: {e}. Trying CLI fallback.")
             if shutil.which("piper"):
@@ -42,27 +51,73 @@ class TextToSpeechService:
             else:
                 logger.warning("Piper not available. TTS will return empty audio.")
 
+    def _load_voice(self, voice_cls: type) -> object:
+        """
+        Load the voice with its ONNX session built once from tuned options: a fixed thread
+        budget so it shares the Pi's cores, on the int8 copy of the model when configured.
+        """
+        model_path = self._model_path
+        if self._config.quantized:
+            quantized_path = get_tts_quantized_model_path(self._config)
+            if os.path.exists(quantized_path):
+                model_path = quantized_path
+            else:
+                logger.warning(f"Quantized Piper model missing, run setup.py: {quantized_path}")
+
+        if self._config.num_threads <= 0 and model_path == self._model_path:
+            return voice_cls.load(self._model_path)
+
+        import onnxruntime
+        from piper.config import PiperConfig
+
+        options = onnxruntime.SessionOptions()
+        if self._config.num_threads > 0:
+            options.intra_op_num_threads = self._config.num_threads
+            options.inter_op_num_threads = 1
+        options.execution_mode = onnxruntime.ExecutionMode.ORT_SEQUENTIAL
+        options.graph_optimization_level = onnxruntime.GraphOptimizationLevel.ORT_ENABLE_ALL
+        # PiperVoice.load cannot take session options, so build the voice the way it does.
+        # The int8 model shares the original's voice config
+        with open(f"{self._model_path}.json", encoding="utf-8") as f:
+            config = PiperConfig.from_dict(json.load(f))
+        session = onnxruntime.InferenceSession(
+            model_path,
+            sess_options=options,
+            providers=["CPUExecutionProvider"],
+        )
+        logger.info(f"Piper ONNX session: {model_path} (threads={self._config.num_threads})")
+        return voice_cls(config=config, session=session)
+
     async def stop(self) -> None:
         self._voice = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
 
     async def synthesize(self, text: str) -> bytes:
         """Synthesize text to raw int16 PCM bytes."""
+        return b"".join([chunk async for chunk in self.synthesize_stream(text)])
+
+    async def synthesize_stream(self, text: str) -> AsyncIterator[bytes]:
+        """Synthesize text, yielding raw int16 PCM bytes as each chunk is ready."""
         if not text.strip():
-            return b""
+            return
 
         if self._voice is not None:
-            return await self._synthesize_python(text)
+            async for chunk in self._synthesize_python(text):
+                yield chunk
         elif self._use_cli:
-            return await self._synthesize_cli(text)
+            yield await self._synthesize_cli(text)
         else:
             logger.warning(f"TTS unavailable, skipping: {text!r}")
-            return b""
 
-    async def _synthesize_python(self, text: str) -> bytes:
+    async def _synthesize_python(self, text: str) -> AsyncIterator[bytes]:
         loop = asyncio.get_running_loop()
+        # Chunks handed over from the executor thread, then None or the error that ended it
+        chunks: asyncio.Queue[bytes | Exception | None] = asyncio.Queue()
 
-        try:
-            def _run() -> bytes:
+        def _run() -> None:
+            try:
                 # Lazy import to avoid hard dependency at module import time
                 from piper.config import SynthesisConfig
 
@@ -76,27 +131,26 @@ class TextToSpeechService:
                     noise_w_scale=self._config.noise_w,
                 )
 
-                # synthesize() returns Iterable[AudioChunk]
-                chunks = self._voice.synthesize(text, syn_config)
-
-                # Concatenate raw int16 PCM bytes
-                audio_bytes = b"".join(
-                    chunk.audio_int16_bytes for chunk in chunks
-                )
-
-                return audio_bytes
-
-            return await loop.run_in_executor(None, _run)
-
-        except Exception as e:
-            raise SynthesisError(f"Piper synthesis failed: {e}") from e
+                # synthesize() returns Iterable[AudioChunk], one per sentence
+                for chunk in self._voice.synthesize(text, syn_config):
+                    loop.call_soon_threadsafe(chunks.put_nowait, chunk.audio_int16_bytes)
+            except Exception as e:
+                loop.call_soon_threadsafe(chunks.put_nowait, e)
+            else:
+                loop.call_soon_threadsafe(chunks.put_nowait, None)
 
+        producer = loop.run_in_executor(self._executor, _run)
+        while (item := await chunks.get()) is not None:
+            if isinstance(item, Exception):
+                raise SynthesisError(f"Piper synthesis failed: {item}") from item
+            yield item
+        await producer
 
     async def _synthesize_cli(self, text: str) -> bytes:
         try:
             proc = await asyncio.create_subprocess_exec(
                 "piper",
-                "--model", get_tts_model_path(self._config),
+                "--model", self._model_path,
                 "--output-raw",
                 stdin=subprocess.PIPE,
                 stdout=subprocess.PIPE,
@@ -1,21 +1,31 @@
 # wake_word.py
 import asyncio
 import logging
+import os
 import platform
+import queue
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from typing import Protocol
 
 import numpy as np
 
 from src.config.schema import WakeWordConfig
-from src.config.utils import get_wake_word_model_path, get_wake_word_melspec_path, get_wake_word_embedding_path
+from src.config.utils import get_wake_word_paths
 
 logger = logging.getLogger(__name__)
 
+# Quiet frames scored before the model is skipped, about 2.5s: enough to fill the
+# mel, embedding and classifier windows so its context is quiet audio either way
+_QUIET_HOLD_FRAMES = 32
+
 
 class WakeWordDetector(Protocol):
     async def start(self) -> None: ...
     async def stop(self) -> None: ...
-    async def detect(self, audio_frame: np.ndarray) -> bool: ...
+    def feed(self, audio_frame: np.ndarray) -> None: ...
+    async def wait_for_wake_word(self) -> bool: ...
     async def reset(self) -> None: ...
 
 
@@ -24,8 +34,21 @@ class OpenWakeWordService:
 
     def __init__(self, config: WakeWordConfig) -> None:
         self._config = config
+        self._paths = get_wake_word_paths(config)
         self._model: object | None = None
         self._disabled = False
+        # Frames from the audio thread, scored on the detection thread; None stops it
+        self._frames: queue.SimpleQueue[np.ndarray | None] = queue.SimpleQueue()
+        self._model_lock = threading.Lock()
+        # Set once the model has scored audio since its last reset
+        self._dirty = False
+        # Reused by the detection thread to join a backlog of frames for one predict call
+        self._batch = np.empty(0, dtype=np.int16)
+        self._worker: threading.Thread | None = None
+        # Model load, warmup and reset stay off the shared default pool
+        self._executor: ThreadPoolExecutor | None = None
+        self._loop: asyncio.AbstractEventLoop | None = None
+        self._detected: asyncio.Future[bool] | None = None
         if platform.system() != "Linux":
             logger.info("Wake word disabled (not running on Linux).")
             self._disabled = True
@@ -40,51 +63,148 @@ class OpenWakeWordService:
             logger.error(f"Unable to import open wake word model on platform {platform.system()}")
             raise e
 
-        model_path = get_wake_word_model_path(self._config)
-        melspec_path = get_wake_word_melspec_path(self._config)
-        embedding_path = get_wake_word_embedding_path(self._config)
+        paths = self._paths
+        model_path = paths.model
         model_args = {
-            "melspec_model_path": melspec_path,
-            "embedding_model_path": embedding_path
+            "melspec_model_path": paths.melspec,
+            "embedding_model_path": paths.embedding
         }
+        # The embedding net dominates runtime and tolerates int8, mel and classifier stay fp32
+        if self._config.quantized_embedding:
+            if os.path.exists(paths.quantized_embedding):
+                model_args["embedding_model_path"] = paths.quantized_embedding
+            else:
+                logger.warning(
+                    "Quantized embedding model missing, run setup.py: %s",
+                    paths.quantized_embedding,
+                )
         if self._config.vad_threshold:
             model_args["vad_threshold"] = self._config.vad_threshold
 
         logger.info(f"Wake word model loading: {model_path}")
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="wakeword")
         loop = asyncio.get_event_loop()
         self._model = await loop.run_in_executor(
-            None,
+            self._executor,
             lambda: Model(
                 wakeword_models=[model_path],
+                inference_framework=self._config.model_extension,
                 **model_args
             ),
         )
         logger.info(f"Wake word model loaded: {model_path}")
 
+        # Score one silent frame so the first real frame does not pay for ONNX session init
+        start = time.monotonic()
+        await loop.run_in_executor(self._executor, self._warmup)
+        logger.info(f"Wake word warmup completed in {time.monotonic() - start:.2f}s")
+
+        self._loop = loop
+        self._worker = threading.Thread(
+            target=self._detection_loop, name="wake-word", daemon=True
+        )
+        self._worker.start()
+
     async def stop(self) -> None:
+        if self._worker is not None:
+            self._frames.put(None)
+            await asyncio.get_running_loop().run_in_executor(self._executor, self._worker.join)
+            self._worker = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+        self._set_detected(False)
         self._model = None
         logger.info("Wake word model unloaded")
 
     async def reset(self) -> None:
         """Reset internal buffers to prevent false triggers."""
-        if self._model is None or self._disabled:
+        if self._model is None or self._disabled or not self._dirty:
             return
-        
+
         loop = asyncio.get_event_loop()
-        await loop.run_in_executor(None, self._model.reset)
+        await loop.run_in_executor(self._executor, self._reset_model)
         logger.debug("Wake word model state reset")
 
-    async def detect(self, audio_frame: np.ndarray) -> bool:
-        if self._model is None or self._disabled:
+    def _join_frames(self, frames: list[np.ndarray]) -> np.ndarray:
+        size = sum(frame.size for frame in frames)
+        if self._batch.size < size:
+            self._batch = np.empty(size, dtype=np.int16)
+        return np.concatenate(frames, out=self._batch[:size])
+
+    def _warmup(self) -> None:
+        self._model.predict(np.zeros(1280, dtype=np.int16))
+        self._model.reset()
+
+    def _reset_model(self) -> None:
+        with self._model_lock:
+            self._model.reset()
+            self._dirty = False
+
+    def feed(self, audio_frame: np.ndarray) -> None:
+        """Queue a frame for detection, safe to call from the audio callback thread."""
+        # Nothing drains the queue without a detection thread
+        if self._worker is not None and self._detected is not None:
+            self._frames.put(audio_frame)
+
+    async def wait_for_wake_word(self) -> bool:
+        """
+        Wait until the detection thread hears the wake word. False if stopped first, or
+        right away when detection is disabled or the model is not loaded.
+        """
+        if self._disabled or self._model is None:
             return False
-
-        loop = asyncio.get_event_loop()
-        prediction = await loop.run_in_executor(
-            None, self._model.predict, audio_frame
-        )
-
-        for name, score in prediction.items():
-            if score >= self._config.threshold:
-                logger.info(f"Wake word detected: {name} (score={score:.3f})")
-                return True
-        return False
+        self._detected = asyncio.get_running_loop().create_future()
+        try:
+            return await self._detected
+        finally:
+            self._detected = None
+
+    def _set_detected(self, detected: bool) -> None:
+        if self._detected is not None and not self._detected.done():
+            self._detected.set_result(detected)
+
+    def _detection_loop(self) -> None:
+        """Score frames as they arrive, waking the event loop only on detection."""
+        max_frames = self._config.max_batch_frames
+        threshold = self._config.threshold
+        # rms <= gate  <=>  sum(x^2) <= gate^2 * n
+        energy_limit = self._config.energy_gate ** 2
+        quiet_frames = 0
+
+        def is_loud(frame: np.ndarray) -> bool:
+            samples = frame.astype(np.int64)
+            return int(np.dot(samples, samples)) > energy_limit * frame.size
+
+        while True:
+            frames = [self._frames.get()]
+            # Frames that queued up while the model ran are scored together in one call
+            while frames[-1] is not None and not self._frames.empty():
+                frames.append(self._frames.get_nowait())
+            if frames[-1] is None:
+                return
+            if self._detected is None:
+                continue  # Stale frames left over from the last wait
+            if len(frames) > max_frames:
+                logger.debug("Dropped %d stale audio frame(s)", len(frames) - max_frames)
+                frames = frames[-max_frames:]
+            if energy_limit:
+                if any(map(is_loud, frames)):
+                    quiet_frames = 0
+                else:
+                    quiet_frames += len(frames)
+                    if quiet_frames > _QUIET_HOLD_FRAMES:
+                        continue  # More quiet audio would not change the model's context
+            audio = frames[0] if len(frames) == 1 else self._join_frames(frames)
+
+            # openwakeword splits longer input into 80ms chunks and reports the max score
+            with self._model_lock:
+                prediction = self._model.predict(audio)
+                self._dirty = True
+
+            # Almost every call is a miss, only look up which model fired on a hit
+            if max(prediction.values()) < threshold:
+                continue
+            name, score = max(prediction.items(), key=lambda item: item[1])
+            logger.info(f"Wake word detected: {name} (score={score:.3f})")
+            self._loop.call_soon_threadsafe(self._set_detected, True)
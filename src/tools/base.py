@@ -1,4 +1,4 @@
-from dataclasses import dataclass, field
+from dataclasses import dataclass
 from typing import Any, Protocol
 
 
@@ -13,9 +13,11 @@ class ToolParameter:
 
 @dataclass(frozen=True)
 class ToolDefinition:
+    """Tools build theirs once as a class constant, parameters is a tuple so it can be shared."""
+
     name: str
     description: str
-    parameters: list[ToolParameter] = field(default_factory=list)
+    parameters: tuple[ToolParameter, ...] = ()
 
 
 class Tool(Protocol):
@@ -9,26 +9,28 @@ logger = logging.getLogger(__name__)
 class DeviceControlTool:
     """Control smart home devices (mock implementation)."""
 
+    _DEFINITION = ToolDefinition(
+        name="device_control",
+        description="Control a smart home device. Can turn devices on or off.",
+        parameters=(
+            ToolParameter(
+                name="device_name",
+                type="string",
+                description="Name of the device to control (e.g., 'living_room_light')",
+                enum=["living_room_light"]
+            ),
+            ToolParameter(
+                name="action",
+                type="string",
+                description="Action to perform on the device",
+                enum=["on", "off"],
+            ),
+        ),
+    )
+
     @property
     def definition(self) -> ToolDefinition:
-        return ToolDefinition(
-            name="device_control",
-            description="Control a smart home device. Can turn devices on or off.",
-            parameters=[
-                ToolParameter(
-                    name="device_name",
-                    type="string",
-                    description="Name of the device to control (e.g., 'living_room_light')",
-                    enum=["living_room_light"]
-                ),
-                ToolParameter(
-                    name="action",
-                    type="string",
-                    description="Action to perform on the device",
-                    enum=["on", "off"],
-                ),
-            ],
-        )
+        return self._DEFINITION
 
     async def execute(self, **kwargs: Any) -> str:
         device_name: str = kwargs.get("device_name", "")
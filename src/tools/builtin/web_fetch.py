@@ -1,7 +1,8 @@
+import asyncio
+import importlib.util
 import logging
 import re
 from typing import Any
-from urllib.parse import urlparse
 
 import httpx
 from bs4 import BeautifulSoup
@@ -12,6 +13,22 @@ logger = logging.getLogger(__name__)
 
 URL_FETCH_TIMEOUT_SECONDS = 10
 MAX_CONTENT_LENGTH = 100_000
+# Markup beyond this is never parsed, visible text is a fraction of the page size
+MAX_HTML_LENGTH = MAX_CONTENT_LENGTH * 4
+# The download stops once this many (decompressed) bytes have arrived
+MAX_DOWNLOAD_BYTES = MAX_CONTENT_LENGTH * 6
+_DOWNLOAD_CHUNK_BYTES = 65_536
+MAX_URLS = 8
+MAX_CONCURRENT_FETCHES = 4
+
+# lxml parses several times faster than the pure Python parser, used when installed
+_HTML_PARSER = "lxml" if importlib.util.find_spec("lxml") else "html.parser"
+_NON_TEXT_TAGS = ["script", "style", "noscript", "svg"]
+
+# Whitespace-delimited tokens that look like URLs, and the http(s) scheme + host prefix
+_URL_TOKEN = re.compile(r"\S*://\S*")
+_HTTP_PREFIX = re.compile(r"https?://", re.IGNORECASE)
+_HOST_START = re.compile(r"[^/?#]")
 
 
 def _extract_urls(text: str) -> tuple[list[str], list[str]]:
@@ -19,29 +36,20 @@ def _extract_urls(text: str) -> tuple[list[str], list[str]]:
     Extract valid http/https URLs from text.
     Returns (valid_urls, errors)
     """
-    tokens = re.split(r"\s+", text)
     valid_urls: list[str] = []
     errors: list[str] = []
 
-    for token in tokens:
-        if "://" not in token:
-            continue
-
-        try:
-            parsed = urlparse(token)
-            if parsed.scheme not in ("http", "https"):
-                errors.append(
-                    f"Unsupported protocol in URL: '{token}'. Only http and https are supported."
-                )
-                continue
-
-            if not parsed.netloc:
-                errors.append(f"Malformed URL detected: '{token}'.")
-                continue
-
-            valid_urls.append(token)
-        except Exception:
+    for match in _URL_TOKEN.finditer(text):
+        token = match.group()
+        scheme = _HTTP_PREFIX.match(token)
+        if scheme is None:
+            errors.append(
+                f"Unsupported protocol in URL: '{token}'. Only http and https are supported."
+            )
+        elif not _HOST_START.match(token, scheme.end()):
             errors.append(f"Malformed URL detected: '{token}'.")
+        else:
+            valid_urls.append(token)
 
     return valid_urls, errors
 
@@ -51,26 +59,31 @@ class WebFetchTool:
     Fetches and processes content from URL(s) embedded in a prompt.
     """
 
+    _DEFINITION = ToolDefinition(
+        name="web_fetch",
+        description=(
+            "Fetch and process content from URL(s) included in a prompt. "
+            "The prompt must include at least one full http:// or https:// URL "
+            "and may include instructions like 'summarize' or 'extract key points'."
+        ),
+        parameters=(
+            ToolParameter(
+                name="prompt",
+                type="string",
+                description=(
+                    "A prompt containing one or more full URLs (http/https) "
+                    "and instructions for processing their content."
+                ),
+            ),
+        ),
+    )
+
+    def __init__(self, client: httpx.AsyncClient) -> None:
+        self._client = client
+
     @property
     def definition(self) -> ToolDefinition:
-        return ToolDefinition(
-            name="web_fetch",
-            description=(
-                "Fetch and process content from URL(s) included in a prompt. "
-                "The prompt must include at least one full http:// or https:// URL "
-                "and may include instructions like 'summarize' or 'extract key points'."
-            ),
-            parameters=[
-                ToolParameter(
-                    name="prompt",
-                    type="string",
-                    description=(
-                        "A prompt containing one or more full URLs (http/https) "
-                        "and instructions for processing their content."
-                    ),
-                ),
-            ],
-        )
+        return self._DEFINITION
 
     async def execute(self, **kwargs: Any) -> str:
         prompt: str = kwargs.get("prompt", "").strip()
@@ -89,8 +102,19 @@ class WebFetchTool:
                 "(starting with http:// or https://)."
             )
 
-        url = valid_urls[0]
+        # Fetch every URL concurrently (duplicates once), results keep prompt order
+        fetch_slots = asyncio.Semaphore(MAX_CONCURRENT_FETCHES)
+
+        async def fetch(url: str) -> str:
+            async with fetch_slots:
+                return await self._fetch(url)
 
+        urls = list(dict.fromkeys(valid_urls))[:MAX_URLS]
+        results = await asyncio.gather(*map(fetch, urls))
+        return "\n\n---\n\n".join(results)
+
+    async def _fetch(self, url: str) -> str:
+        """Fetch one URL and return its text content, or an error message."""
         # Convert GitHub blob URLs to raw
         if "github.com" in url and "/blob/" in url:
             url = url.replace("github.com", "raw.githubusercontent.com").replace(
@@ -100,24 +124,34 @@ class WebFetchTool:
         logger.info(f"Fetching URL: {url}")
 
         try:
-            async with httpx.AsyncClient(timeout=URL_FETCH_TIMEOUT_SECONDS) as client:
-                response = await client.get(url)
-
-            if response.status_code != 200:
-                return (
-                    f"Error: Request failed with status code "
-                    f"{response.status_code}."
-                )
+            async with self._client.stream(
+                "GET", url, timeout=URL_FETCH_TIMEOUT_SECONDS
+            ) as response:
+                if response.status_code != 200:
+                    return (
+                        f"Error: Request failed with status code "
+                        f"{response.status_code}."
+                    )
+
+                # Stream the body and stop at the cap instead of downloading it all
+                chunks: list[bytes] = []
+                total = 0
+                async for chunk in response.aiter_bytes(_DOWNLOAD_CHUNK_BYTES):
+                    chunks.append(chunk)
+                    total += len(chunk)
+                    if total >= MAX_DOWNLOAD_BYTES:
+                        break
 
             content_type = response.headers.get("content-type", "")
-            raw_content = response.text
+            # A capped body may end mid-character
+            raw_content = b"".join(chunks).decode(response.encoding or "utf-8", errors="replace")
 
             # Convert HTML to plain text if needed
             if "text/html" in content_type.lower() or not content_type:
-                soup = BeautifulSoup(raw_content, "html.parser")
+                soup = BeautifulSoup(raw_content[:MAX_HTML_LENGTH], _HTML_PARSER)
 
-                # Remove scripts and styles
-                for tag in soup(["script", "style"]):
+                # Remove scripts, styles and other non-text markup
+                for tag in soup(_NON_TEXT_TAGS):
                     tag.decompose()
 
                 text_content = soup.get_text(separator="\n")
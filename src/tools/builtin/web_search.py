@@ -16,25 +16,28 @@ class WebSearchTool:
     Performs a web search using Brave Search API.
     """
 
-    def __init__(self, api_key: str) -> None:
+    _DEFINITION = ToolDefinition(
+        name="web_search",
+        description=(
+            "Search the web for current information based on a query. "
+            "Use this for recent events, news, or facts you're unsure about. "
+        ),
+        parameters=(
+            ToolParameter(
+                name="query",
+                type="string",
+                description="The search query to find information on the web.",
+            ),
+        ),
+    )
+
+    def __init__(self, api_key: str, client: httpx.AsyncClient) -> None:
         self._api_key = api_key
+        self._client = client
 
     @property
     def definition(self) -> ToolDefinition:
-        return ToolDefinition(
-            name="web_search",
-            description=(
-                "Search the web for current information based on a query. "
-                "Use this for recent events, news, or facts you're unsure about. "
-            ),
-            parameters=[
-                ToolParameter(
-                    name="query",
-                    type="string",
-                    description="The search query to find information on the web.",
-                ),
-            ],
-        )
+        return self._DEFINITION
 
     async def execute(self, **kwargs: Any) -> str:
         query: str = kwargs.get("query", "").strip()
@@ -45,18 +48,18 @@ class WebSearchTool:
         logger.info(f"Performing Brave web search for query: {query}")
 
         try:
-            async with httpx.AsyncClient(timeout=SEARCH_TIMEOUT_SECONDS) as client:
-                response = await client.get(
-                    "https://api.search.brave.com/res/v1/web/search",
-                    params={
-                        "q": query,
-                        "count": MAX_RESULTS,
-                    },
-                    headers={
-                        "X-Subscription-Token": self._api_key,
-                        "Accept": "application/json",
-                    },
-                )
+            response = await self._client.get(
+                "https://api.search.brave.com/res/v1/web/search",
+                params={
+                    "q": query,
+                    "count": MAX_RESULTS,
+                },
+                headers={
+                    "X-Subscription-Token": self._api_key,
+                    "Accept": "application/json",
+                },
+                timeout=SEARCH_TIMEOUT_SECONDS,
+            )
 
             if response.status_code == 401:
                 return "Error: Invalid Brave Search API key."
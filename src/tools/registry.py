@@ -11,6 +11,7 @@ class ToolRegistry:
 
     def __init__(self) -> None:
         self._tools: dict[str, Tool] = {}
+        self._version = 0
 
     def register(self, tool: Tool) -> None:
         """Register a tool. Raises ValueError if name already taken."""
@@ -18,8 +19,14 @@ class ToolRegistry:
         if name in self._tools:
             raise ValueError(f"Tool already registered: {name}")
         self._tools[name] = tool
+        self._version += 1
         logger.info(f"Registered tool: {name}")
 
+    @property
+    def version(self) -> int:
+        """Incremented on every registration, lets callers cache derived data."""
+        return self._version
+
     def get(self, name: str) -> Tool | None:
         return self._tools.get(name)
 
@@ -66,9 +73,11 @@ class ToolRegistry:
             available = list(self._tools.keys())
             return f"Error: Unknown tool '{name}'. Available tools: {available}"
         try:
-            logger.info(f"Calling tool '{name}' with args: {arguments}")
+            # Lazy %-formatting, results can be large (web pages) and are only
+            # formatted when INFO is enabled, truncated to keep the log readable
+            logger.info("Calling tool '%s' with args: %s", name, arguments)
             result = await tool.execute(**arguments)
-            logger.info(f"Tool '{name}' returned: {result}")
+            logger.info("Tool '%s' returned (%d chars): %.200s", name, len(result), result)
             return result
         except Exception as e:
             logger.exception(f"Tool '{name}' raised unexpected error")
@@ -0,0 +1,14 @@
+import functools
+
+
+@functools.lru_cache(maxsize=1)
+def query_devices() -> tuple[dict, ...]:
+    """Enumerate PortAudio devices once, capture and playback resolve against the same list."""
+    import sounddevice as sd
+
+    return tuple(sd.query_devices())
+
+
+def refresh_devices() -> None:
+    """Drop the cached enumeration, e.g. after a device was plugged in."""
+    query_devices.cache_clear()
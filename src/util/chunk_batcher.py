@@ -14,11 +14,18 @@ class ChunkBatcher:
         min_chars: int = 50,
         max_chars: int = 200,
         min_words: int = 5,
+        first_min_chars: int | None = None,
     ) -> None:
         self._min_chars = min_chars
         self._max_chars = max_chars
         self._min_words = min_words
+        # First batch may be smaller so speech starts sooner, then the minimum
+        # doubles per batch until it reaches min_chars
+        self._current_min = min(first_min_chars or min_chars, min_chars)
         self._buffer = ""
+        # Boundary scans resume here, earlier positions were already ruled out
+        self._sentence_scan_pos = 0
+        self._pause_scan_pos = 0
     
     def add(self, text: str) -> list[str]:
         """Add text and return any complete batches."""
@@ -29,7 +36,7 @@ class ChunkBatcher:
         """Flush remaining buffer."""
         if self._buffer.strip():
             result = self._buffer.strip()
-            self._buffer = ""
+            self._set_buffer("")
             return result
         return None
     
@@ -42,29 +49,35 @@ class ChunkBatcher:
             if batch is None:
                 break
             batches.append(batch)
+            self._current_min = min(self._current_min * 2, self._min_chars)
         
         return batches
     
     def _try_extract_batch(self) -> str | None:
         """Try to extract a single batch from buffer."""
         # Not enough content yet
-        if len(self._buffer) < self._min_chars:
+        if len(self._buffer) < self._current_min:
             return None
         
         # Force split if buffer exceeds max
         if len(self._buffer) >= self._max_chars:
             return self._split_at_best_point(self._max_chars)
         
-        # Look for sentence boundary
-        match = self.SENTENCE_END.search(self._buffer)
-        if match and match.end() >= self._min_chars:
-            return self._extract_at(match.end())
+        # Look for the first sentence boundary past the minimum. A boundary is a
+        # mark followed by whitespace or the end, so only newly added text can hold one
+        start = max(self._sentence_scan_pos, self._current_min - 2, 0)
+        for match in self.SENTENCE_END.finditer(self._buffer, start):
+            if match.end() >= self._current_min:
+                return self._extract_at(match.end())
+        self._sentence_scan_pos = len(self._buffer)
         
         # Look for pause point if buffer is getting long
-        if len(self._buffer) >= self._min_chars * 1.5:
-            match = self.PAUSE_POINTS.search(self._buffer, pos=self._min_chars)
+        if len(self._buffer) >= self._current_min * 1.5:
+            start = max(self._pause_scan_pos, self._current_min)
+            match = self.PAUSE_POINTS.search(self._buffer, pos=start)
             if match:
                 return self._extract_at(match.end())
+            self._pause_scan_pos = len(self._buffer)
         
         return None
     
@@ -75,21 +88,21 @@ class ChunkBatcher:
         # Prefer sentence end
         match = None
         for m in self.SENTENCE_END.finditer(search_region):
-            if m.end() >= self._min_chars:
+            if m.end() >= self._current_min:
                 match = m
         if match:
             return self._extract_at(match.end())
         
         # Then pause point
         for m in self.PAUSE_POINTS.finditer(search_region):
-            if m.end() >= self._min_chars:
+            if m.end() >= self._current_min:
                 match = m
         if match:
             return self._extract_at(match.end())
         
         # Then word boundary
         last_space = search_region.rfind(' ')
-        if last_space > self._min_chars:
+        if last_space > self._current_min:
             return self._extract_at(last_space + 1)
         
         # Last resort: hard cut
@@ -98,8 +111,14 @@ class ChunkBatcher:
     def _extract_at(self, pos: int) -> str:
         """Extract text up to pos from buffer."""
         result = self._buffer[:pos].strip()
-        self._buffer = self._buffer[pos:].lstrip()
+        self._set_buffer(self._buffer[pos:].lstrip())
         return result
+
+    def _set_buffer(self, text: str) -> None:
+        """Replace the buffer, scans start over on the new contents."""
+        self._buffer = text
+        self._sentence_scan_pos = 0
+        self._pause_scan_pos = 0
     
     def _word_count(self, text: str) -> int:
         return len(text.split())
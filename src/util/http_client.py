@@ -0,0 +1,15 @@
+import importlib.util
+
+import httpx
+
+DEFAULT_TIMEOUT_SECONDS = 10
+
+
+def create_http_client() -> httpx.AsyncClient:
+    """One pooled client for all tools, so repeat requests reuse connections and TLS sessions."""
+    return httpx.AsyncClient(
+        # HTTP/2 multiplexes requests to the same host over one connection, needs h2 installed
+        http2=importlib.util.find_spec("h2") is not None,
+        limits=httpx.Limits(max_keepalive_connections=10),
+        timeout=DEFAULT_TIMEOUT_SECONDS,
+    )
@@ -1,3 +1,4 @@
+import functools
 import logging
 
 from datetime import datetime
@@ -8,24 +9,34 @@ from src.tools.registry import ToolRegistry
 
 logger = logging.getLogger(__name__)
 
+
+@functools.lru_cache(maxsize=1)
+def _load_system_prompt_template() -> Template:
+    """Read and compile the system prompt template once per process."""
+    with open("./prompts/system_prompt.txt") as f:
+        return Template(f.read())
+
+
+@functools.lru_cache(maxsize=8)
+def _load_reminder_template(reminder_name: str) -> Template:
+    """Read and compile a system reminder template once per process."""
+    with open(f"./prompts/system_reminders/{reminder_name}.txt") as f:
+        return Template(f.read())
+
+
 class PromptLoader:
     @staticmethod
     def load_system_prompt(config: AgentConfig, tool_registry: ToolRegistry) -> str:
         if config.system_prompt:
             return config.system_prompt
         tool_names = list(map(lambda tool: tool.name, tool_registry.list_tools()))
-        with open("./prompts/system_prompt.txt") as f:
-            template = Template(f.read())
-            full_sys_prompt = template.render(tools=tool_names)
-            return full_sys_prompt
+        template = _load_system_prompt_template()
+        return template.render(tools=tool_names)
     
     @staticmethod
     def _load_system_reminder(reminder_name, **kwargs) -> str | None:
         try:
-            with open(f"./prompts/system_reminders/{reminder_name}.txt") as f:
-                template = Template(f.read())
-                reminder = template.render(**kwargs)
-                return reminder
+            return _load_reminder_template(reminder_name).render(**kwargs)
         except Exception as e:
             logger.error(f"Failed to load system reminder: {reminder_name}")
             return None
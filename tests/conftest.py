@@ -0,0 +1,9 @@
+import asyncio
+
+# Async tests run on uvloop's event loop when it is installed (not available on Windows)
+try:
+    import uvloop
+except ImportError:
+    pass
+else:
+    asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
@@ -1,6 +1,4 @@
-from dataclasses import dataclass, field
 from typing import Any
-from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
@@ -32,24 +30,47 @@ def make_tool_call(name: str, arguments: dict[str, Any]) -> dict:
     }
 
 
+class FakeOllama:
+    """Stands in for ollama.AsyncClient, each chat() call streams the next scripted response.
+
+    The last response repeats once the script runs out.
+    """
+
+    def __init__(self, *responses: list[dict]) -> None:
+        self._responses = responses
+        self.calls = 0
+
+    async def chat(self, **kwargs: Any):
+        chunks = self._responses[min(self.calls, len(self._responses) - 1)]
+        self.calls += 1
+        return self._stream(chunks)
+
+    @staticmethod
+    async def _stream(chunks: list[dict]):
+        for chunk in chunks:
+            yield chunk
+
+
 class EchoTool:
     """Simple test tool that echoes input."""
 
+    _DEFINITION = ToolDefinition(
+        name="echo",
+        description="Echo back the input",
+        parameters=(
+            ToolParameter(name="text", type="string", description="Text to echo"),
+        ),
+    )
+
     @property
     def definition(self) -> ToolDefinition:
-        return ToolDefinition(
-            name="echo",
-            description="Echo back the input",
-            parameters=[
-                ToolParameter(name="text", type="string", description="Text to echo"),
-            ],
-        )
+        return self._DEFINITION
 
     async def execute(self, **kwargs: Any) -> str:
         return f"Echo: {kwargs.get('text', '')}"
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def agent_config():
     return AgentConfig(
         model="test-model",
@@ -58,7 +79,7 @@ def agent_config():
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def registry():
     r = ToolRegistry()
     r.register(EchoTool())
@@ -77,96 +98,96 @@ def agent(agent_config, registry):
     return AgentService(agent_config, registry)
 
 
-@pytest.mark.asyncio
 async def test_run_not_started(agent, session):
-    with pytest.raises(AgentError, match="not started"):
+    with pytest.raises(AgentError) as exc:
         async for _ in agent.run("hello", session):
             pass
+    assert "not started" in str(exc.value)
+
+
+# (scripted responses, expected yielded chunks, expected message count, {index: (role, content)})
+RUN_SCENARIOS = [
+    pytest.param(
+        [[make_chunk(content="Hello "), make_chunk(content="world!")]],
+        ["Hello ", "world!"],
+        3,  # system, user, assistant
+        {1: ("user", "hi"), 2: ("assistant", "Hello world!")},
+        id="text_response",
+    ),
+    pytest.param(
+        [
+            # First call: LLM requests a tool call
+            [make_chunk(content="", tool_calls=[make_tool_call("echo", {"text": "test"})])],
+            # Second call: LLM responds with text after seeing tool result
+            [make_chunk(content="Done!")],
+        ],
+        ["Done!"],
+        5,  # system, user, assistant(tool_call), tool(result), assistant(text)
+        {3: ("tool", "Echo: test")},
+        id="tool_call",
+    ),
+    pytest.param(
+        # LLM keeps requesting tools, the agent stops after max_tool_rounds (3) + 1 rounds,
+        # each yielding its "calling tool" text
+        [[make_chunk(
+            content="calling tool",
+            tool_calls=[make_tool_call("echo", {"text": "loop"})],
+        )]],
+        ["calling tool"] * 4,
+        10,  # system, user, then assistant + tool per round
+        {},
+        id="max_tool_rounds",
+    ),
+]
+
+
+@pytest.mark.parametrize("responses,expected_chunks,message_count,expected_messages", RUN_SCENARIOS)
+async def test_run(agent, session, responses, expected_chunks, message_count, expected_messages):
+    """Agent streams text, runs requested tools and records the conversation."""
+    agent._client = FakeOllama(*responses)
+
+    chunks = [chunk async for chunk in agent.run("hi", session)]
+
+    assert chunks == expected_chunks
+    assert len(session.messages) == message_count
+    for index, (role, content) in expected_messages.items():
+        assert session.messages[index].role == role
+        assert session.messages[index].content == content
+
+
+async def test_run_with_multiple_tool_calls(agent, session):
+    """Tool calls in one round run together and their results keep the call order."""
+    agent._client = FakeOllama(
+        [make_chunk(tool_calls=[
+            make_tool_call("echo", {"text": "first"}),
+            make_tool_call("echo", {"text": "second"}),
+        ])],
+        [make_chunk(content="Done!")],
+    )
 
+    async for _ in agent.run("echo twice", session):
+        pass
 
-@pytest.mark.asyncio
-async def test_run_simple_text_response(agent, session):
-    """Agent streams a simple text response with no tool calls."""
-    mock_client = AsyncMock()
-
-    async def mock_stream():
-        yield make_chunk(content="Hello ")
-        yield make_chunk(content="world!")
-
-    mock_client.chat.return_value = mock_stream()
-    agent._client = mock_client
-
-    chunks = []
-    async for chunk in agent.run("hi", session):
-        chunks.append(chunk)
-
-    assert chunks == ["Hello ", "world!"]
-    # Session should have: system, user, assistant
-    assert len(session.messages) == 3
-    assert session.messages[1].role == "user"
-    assert session.messages[1].content == "hi"
-    assert session.messages[2].role == "assistant"
-    assert session.messages[2].content == "Hello world!"
+    # Session: system, user, assistant(tool_calls), tool, tool, assistant(text)
+    assert [m.content for m in session.messages[3:5]] == ["Echo: first", "Echo: second"]
 
 
-@pytest.mark.asyncio
-async def test_run_with_tool_call(agent, session):
-    """Agent makes a tool call, then responds with text."""
-    mock_client = AsyncMock()
+def test_system_prompt_cached_until_registry_changes(agent_config):
+    """Prompt and tool schema are built once and rebuilt only when tools are registered."""
+    registry = ToolRegistry()  # Own registry, the shared one must not gain tools
+    registry.register(EchoTool())
+    agent = AgentService(agent_config, registry)
+    prompt = agent.system_prompt
+    tools = agent._ollama_tools
+    assert agent.system_prompt is prompt
+    assert agent._ollama_tools is tools
 
-    call_count = 0
+    class OtherTool(EchoTool):
+        @property
+        def definition(self) -> ToolDefinition:
+            return ToolDefinition(name="other", description="Another tool")
 
-    async def mock_chat(**kwargs):
-        nonlocal call_count
-        call_count += 1
-        if call_count == 1:
-            # First call: LLM requests a tool call
-            async def stream1():
-                yield make_chunk(
-                    content="",
-                    tool_calls=[make_tool_call("echo", {"text": "test"})],
-                )
-            return stream1()
-        else:
-            # Second call: LLM responds with text after seeing tool result
-            async def stream2():
-                yield make_chunk(content="Done!")
-            return stream2()
-
-    mock_client.chat = mock_chat
-    agent._client = mock_client
-
-    chunks = []
-    async for chunk in agent.run("echo test", session):
-        chunks.append(chunk)
-
-    assert "Done!" in chunks
-    # Session: system, user, assistant(tool_call), tool(result), assistant(text)
-    assert len(session.messages) == 5
-    assert session.messages[3].role == "tool"
-    assert "Echo: test" in session.messages[3].content
-
-
-@pytest.mark.asyncio
-async def test_max_tool_rounds(agent, session):
-    """Agent stops after max_tool_rounds even if LLM keeps requesting tools."""
-    mock_client = AsyncMock()
-
-    async def mock_chat(**kwargs):
-        async def stream():
-            yield make_chunk(
-                content="calling tool",
-                tool_calls=[make_tool_call("echo", {"text": "loop"})],
-            )
-        return stream()
-
-    mock_client.chat = mock_chat
-    agent._client = mock_client
-
-    chunks = []
-    async for chunk in agent.run("loop", session):
-        chunks.append(chunk)
-
-    # Should have done max_tool_rounds + 1 iterations (0 to max_tool_rounds inclusive)
-    # Each yields "calling tool" text, so we get max_tool_rounds + 1 chunks
-    assert len(chunks) == agent._config.max_tool_rounds + 1
\ No newline at end of file
+    registry.register(OtherTool())
+    new_prompt = agent.system_prompt
+    assert new_prompt is not prompt
+    assert [t["function"]["name"] for t in agent._ollama_tools] == ["echo", "other"]
@@ -0,0 +1,98 @@
+import asyncio
+import sys
+import threading
+import types
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from src.config.schema import AudioConfig
+from src.services.audio_capture import LiveAudioCaptureService
+
+
+class FakeRawInputStream:
+    """Stands in for sounddevice.RawInputStream and exposes the audio callback."""
+
+    def __init__(self, callback, **kwargs) -> None:
+        self.callback = callback
+
+    def start(self) -> None:
+        pass
+
+    def stop(self) -> None:
+        pass
+
+    def close(self) -> None:
+        pass
+
+
+@pytest.fixture
+async def capture():
+    sd = types.ModuleType("sounddevice")
+    sd.RawInputStream = FakeRawInputStream
+    with patch.dict(sys.modules, {"sounddevice": sd}):
+        service = LiveAudioCaptureService(AudioConfig())
+        await service.start()
+        yield service
+        await service.stop()
+
+
+def frame_bytes(service: LiveAudioCaptureService, value: int) -> bytes:
+    return np.full(service._frame_size, value, dtype=np.int16).tobytes()
+
+
+async def test_stream_frames_from_audio_thread(capture):
+    capture.start_capture()
+    callback = capture._stream.callback
+
+    def produce() -> None:
+        for i in range(1, 6):
+            callback(frame_bytes(capture, i), capture._frame_size, None, None)
+
+    received = []
+    threading.Thread(target=produce).start()
+    async for frame in capture.stream_frames():
+        received.append(int(frame[0]))
+        if len(received) == 5:
+            break
+
+    assert received == [1, 2, 3, 4, 5]
+
+
+async def test_start_capture_skips_stale_frames(capture):
+    capture.start_capture()
+    callback = capture._stream.callback
+    callback(frame_bytes(capture, 1), capture._frame_size, None, None)
+    capture.stop_capture()
+
+    capture.start_capture()
+    callback(frame_bytes(capture, 2), capture._frame_size, None, None)
+    async for frame in capture.stream_frames():
+        assert frame[0] == 2
+        break
+
+
+async def test_stop_wakes_waiting_consumer(capture):
+    capture.start_capture()
+
+    async def consume() -> list:
+        return [frame async for frame in capture.stream_frames()]
+
+    consumer = asyncio.create_task(consume())
+    await asyncio.sleep(0)
+    capture.stop_capture()
+
+    assert await asyncio.wait_for(consumer, timeout=1) == []
+
+
+async def test_frame_sink_receives_frames(capture):
+    capture.start_capture()
+    received = []
+    capture.set_frame_sink(lambda frame: received.append(int(frame[0])))
+    callback = capture._stream.callback
+    for i in range(1, 4):
+        callback(frame_bytes(capture, i), capture._frame_size, None, None)
+    capture.set_frame_sink(None)
+
+    assert received == [1, 2, 3]
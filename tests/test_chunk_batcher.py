@@ -0,0 +1,55 @@
+from src.util.chunk_batcher import ChunkBatcher
+
+
+def feed(batcher: ChunkBatcher, text: str) -> list[str]:
+    """Feed text word by word, the way the agent streams it."""
+    batches: list[str] = []
+    for word in text.split(" "):
+        batches.extend(batcher.add(word + " "))
+    remaining = batcher.flush()
+    if remaining:
+        batches.append(remaining)
+    return batches
+
+
+def test_splits_on_sentence_end():
+    batcher = ChunkBatcher(min_chars=10, max_chars=200)
+    assert feed(batcher, "This is one sentence. And this is another one.") == [
+        "This is one sentence.",
+        "And this is another one.",
+    ]
+
+
+def test_holds_short_text_until_flush():
+    batcher = ChunkBatcher(min_chars=50, max_chars=200)
+    assert batcher.add("Short. ") == []
+    assert batcher.flush() == "Short."
+    assert batcher.flush() is None
+
+
+def test_force_split_at_max_chars():
+    batcher = ChunkBatcher(min_chars=10, max_chars=40)
+    batches = feed(batcher, "word " * 30)
+    assert all(len(b) <= 40 for b in batches)
+    assert " ".join(batches).split() == ["word"] * 30
+
+
+def test_first_batch_is_smaller():
+    text = "Sure thing. I can help you with that request today. Here is what I found out."
+    progressive = feed(ChunkBatcher(min_chars=40, max_chars=200, first_min_chars=10), text)
+    fixed = feed(ChunkBatcher(min_chars=40, max_chars=200), text)
+    assert progressive[0] == "Sure thing."
+    assert len(fixed[0]) > len(progressive[0])
+    assert " ".join(progressive) == " ".join(fixed) == text
+
+
+def test_splits_text_streamed_one_character_at_a_time():
+    text = "Well, that depends on the weather; it may rain. Bring a coat, just in case."
+    batcher = ChunkBatcher(min_chars=10, max_chars=60)
+    assert [batch for char in text for batch in batcher.add(char)] == [
+        "Well, that depends on the weather;",
+        "it may rain.",
+        "Bring a coat,",
+        "just in case.",
+    ]
+    assert batcher.flush() is None
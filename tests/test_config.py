@@ -1,45 +1,49 @@
-import os
-import tempfile
+import dataclasses
 from pathlib import Path
 
 import pytest
 import yaml
 
+from src.config import loader
 from src.config.loader import load_config
-from src.config.schema import AppConfig
+from src.config.schema import AgentConfig, AppConfig
+from src.config.secrets import load_secrets
 
 
-def test_load_default_config():
-    """Loading with no files produces valid defaults."""
+@pytest.fixture(scope="module")
+def default_config():
+    """Config loaded with no files, shared by tests that only read it."""
     config, _ = load_config(
         config_path=Path("/nonexistent/config.yaml"),
         env_path=Path("/nonexistent/.env"),
     )
+    return config
+
+
+def test_load_default_config(default_config):
+    """Loading with no files produces valid defaults."""
+    config = default_config
     assert isinstance(config, AppConfig)
     assert config.agent.model == "qwen2.5:1.5b"
     assert config.stt.model_size == "base.en"
     assert config.session.idle_timeout_seconds == 30.0
 
 
-def test_load_yaml_config():
+def test_load_yaml_config(tmp_path):
     """YAML values override defaults."""
     data = {
         "agent": {"model": "llama3.2:3b", "temperature": 0.5},
         "stt": {"model_size": "tiny.en"},
     }
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".yaml", delete=False) as f:
-        yaml.dump(data, f)
-        tmp_path = Path(f.name)
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(yaml.safe_dump(data))
 
-    try:
-        config, _ = load_config(config_path=tmp_path, env_path=Path("/nonexistent/.env"))
-        assert config.agent.model == "llama3.2:3b"
-        assert config.agent.temperature == 0.5
-        assert config.stt.model_size == "tiny.en"
-        # Non-overridden values keep defaults
-        assert config.wake_word.model_name == "hey_jarvis_v0.1"
-    finally:
-        tmp_path.unlink()
+    config, _ = load_config(config_path=config_path, env_path=tmp_path / "missing.env")
+    assert config.agent.model == "llama3.2:3b"
+    assert config.agent.temperature == 0.5
+    assert config.stt.model_size == "tiny.en"
+    # Non-overridden values keep defaults
+    assert config.wake_word.model_name == "hey_jarvis_v0.1"
 
 
 def test_env_override(monkeypatch):
@@ -53,33 +57,72 @@ def test_env_override(monkeypatch):
     assert config.agent.system_prompt == sys_prompt
 
 
-def test_load_env_file():
+def test_load_env_file(tmp_path, monkeypatch):
     """Values from .env file are loaded."""
-    with tempfile.NamedTemporaryFile(mode="w", suffix=".env", delete=False) as f:
-        f.write('AGENT_SYSTEM_PROMPT=Hello\n')
-        env_path = Path(f.name)
-
-    # Clear any existing env var so .env file takes effect
-    old_val = os.environ.pop("AGENT_SYSTEM_PROMPT", None)
-    try:
-        config, _ = load_config(
-            config_path=Path("/nonexistent/config.yaml"),
-            env_path=env_path,
-        )
-        assert config.agent.system_prompt == "Hello"
-    finally:
-        env_path.unlink()
-        if old_val is not None:
-            os.environ["AGENT_SYSTEM_PROMPT"] = old_val
-        else:
-            os.environ.pop("AGENT_SYSTEM_PROMPT", None)
-
-
-def test_frozen_config():
-    """Config dataclasses are immutable."""
+    env_path = tmp_path / ".env"
+    env_path.write_text("AGENT_SYSTEM_PROMPT=Hello\n")
+
+    # Clear any existing env var so .env file takes effect. Loading the .env sets it,
+    # setenv first makes monkeypatch restore the original value or absence afterwards
+    monkeypatch.setenv("AGENT_SYSTEM_PROMPT", "")
+    monkeypatch.delenv("AGENT_SYSTEM_PROMPT")
     config, _ = load_config(
-        config_path=Path("/nonexistent/config.yaml"),
-        env_path=Path("/nonexistent/.env"),
+        config_path=tmp_path / "missing.yaml",
+        env_path=env_path,
     )
+    assert config.agent.system_prompt == "Hello"
+
+
+@pytest.mark.parametrize("text,expected", [
+    ("BRAVE_SEARCH_API_KEY=abc#123\n", "abc#123"),
+    ("BRAVE_SEARCH_API_KEY=abc #comment\n", "abc"),
+    ("export BRAVE_SEARCH_API_KEY='abc # 123' # comment\n", "abc # 123"),
+    ('BRAVE_SEARCH_API_KEY="a\\"b"\n', 'a"b'),
+    ("PREFIX=abc\nBRAVE_SEARCH_API_KEY=${PREFIX}123\n", "abc123"),
+])
+def test_load_secrets_env_values(tmp_path, monkeypatch, text, expected):
+    """Values from the .env file are parsed like python-dotenv documents them."""
+    env_path = tmp_path / ".env"
+    env_path.write_text(text)
+
+    for key in ("BRAVE_SEARCH_API_KEY", "PREFIX"):
+        monkeypatch.setenv(key, "")
+        monkeypatch.delenv(key)
+    assert load_secrets(env_path).brave_search_api_key == expected
+
+
+def test_frozen_config(default_config):
+    """Config dataclasses are immutable."""
     with pytest.raises(AttributeError):
-        config.agent = None  # type: ignore[misc]
+        default_config.agent = None  # type: ignore[misc]
+
+
+def test_config_cache_invalidated_on_change(tmp_path):
+    """Cached config is reused until config.yaml changes."""
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(yaml.dump({"agent": {"model": "llama3.2:3b"}}))
+
+    config, _ = load_config(config_path=config_path, env_path=Path("/nonexistent/.env"))
+    assert (tmp_path / ".config.cache.pkl").exists()
+    cached, _ = load_config(config_path=config_path, env_path=Path("/nonexistent/.env"))
+    assert cached == config
+
+    config_path.write_text(yaml.dump({"agent": {"model": "qwen2.5:3b"}}))
+    config, _ = load_config(config_path=config_path, env_path=Path("/nonexistent/.env"))
+    assert config.agent.model == "qwen2.5:3b"
+
+
+def test_config_cache_invalidated_on_schema_change(tmp_path, monkeypatch):
+    """A changed schema default makes a cached config stale."""
+    config_path = tmp_path / "config.yaml"
+    config_path.write_text(yaml.safe_dump({"agent": {"model": "llama3.2:3b"}}))
+    load_config(config_path=config_path, env_path=tmp_path / "missing.env")
+
+    # Rebuild the fingerprint as if AgentConfig.temperature had a new default
+    fields = {f.name: f for f in dataclasses.fields(AgentConfig)}
+    monkeypatch.setattr(fields["temperature"], "default", 0.2)
+    monkeypatch.setattr(loader, "_SCHEMA_FINGERPRINT", loader._schema_fingerprint())
+    monkeypatch.setattr(loader, "_parse_yaml", lambda raw: {"agent": {"model": "reparsed"}})
+
+    config, _ = load_config(config_path=config_path, env_path=tmp_path / "missing.env")
+    assert config.agent.model == "reparsed"
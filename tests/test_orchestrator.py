@@ -0,0 +1,161 @@
+import asyncio
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from src.config.schema import AppConfig, AudioConfig
+from src.core.orchestrator import Orchestrator
+from src.core.session import Session
+from src.core.signal_bus import SignalBus
+from src.core.state import AssistantState
+
+LOUD = np.full(1280, 2000, dtype=np.int16)
+QUIET = np.zeros(1280, dtype=np.int16)
+
+
+class FakeCapture:
+    """Replays a fixed list of frames, optionally failing once they run out."""
+
+    def __init__(self, frames: list[np.ndarray], error: Exception | None = None) -> None:
+        self.frames = frames
+        self.error = error
+
+    def start_capture(self) -> None:
+        pass
+
+    def stop_capture(self) -> None:
+        pass
+
+    async def stream_frames(self):
+        for frame in self.frames:
+            yield frame
+            await asyncio.sleep(0)
+        if self.error is not None:
+            raise self.error
+
+
+class SlowSTT:
+    """Transcriptions block until released, like Whisper busy on the STT worker."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.release = asyncio.Event()
+
+    async def transcribe(self, audio: np.ndarray) -> str:
+        self.calls += 1
+        await self.release.wait()
+        return "hello"
+
+
+class BlockedTTS:
+    """Synthesis never finishes, like Piper still working on a long batch."""
+
+    def __init__(self) -> None:
+        self.started = 0
+
+    async def synthesize_stream(self, text: str):
+        self.started += 1
+        await asyncio.Event().wait()
+        yield b""
+
+
+class FailingAgent:
+    """Streams a few sentences, then fails mid-response."""
+
+    system_prompt = "sys"
+
+    async def run(self, text: str, session: Session):
+        for _ in range(3):
+            yield "This sentence is long enough to be spoken as its own batch. "
+            await asyncio.sleep(0)
+        raise RuntimeError("model crashed")
+
+
+class FakeWakeWord:
+    async def reset(self) -> None:
+        pass
+
+
+def make_orchestrator(
+    capture: FakeCapture | None = None,
+    stt: SlowSTT | None = None,
+    agent: FailingAgent | None = None,
+    tts: BlockedTTS | None = None,
+    config: AppConfig | None = None,
+) -> Orchestrator:
+    config = config or AppConfig()
+    orchestrator = Orchestrator(
+        args=SimpleNamespace(no_wake_wait=True),
+        config=config,
+        wake_word=FakeWakeWord(),
+        audio_capture=capture,
+        stt=stt,
+        agent=agent,
+        tts=tts,
+        audio_playback=None,
+        session=Session(config.session),
+        signal_bus=SignalBus(),
+    )
+    orchestrator._running = True
+    orchestrator._skip_greeting = True
+    orchestrator._state = AssistantState.LISTENING
+    return orchestrator
+
+
+async def test_no_new_speculation_while_discarded_one_runs():
+    # Pause long enough to speculate (6 frames), resume speaking, pause again, then stop
+    frames = [LOUD] * 5 + [QUIET] * 6 + [LOUD] * 2 + [QUIET] * 18
+    stt = SlowSTT()
+    orchestrator = make_orchestrator(FakeCapture(frames), stt)
+
+    await orchestrator._handle_listening()
+
+    assert stt.calls == 1
+    assert orchestrator._pending_transcription is None
+    assert orchestrator._state is AssistantState.TRANSCRIBING
+    stt.release.set()
+
+
+async def test_long_frames_speculate_only_after_a_pause():
+    # 1s frames are longer than the 0.5s pause that starts a speculative transcription
+    config = AppConfig(audio=AudioConfig(frame_duration_ms=1000))
+    loud = np.full(16_000, 2000, dtype=np.int16)
+    quiet = np.zeros(16_000, dtype=np.int16)
+    stt = SlowSTT()
+    stt.release.set()
+    orchestrator = make_orchestrator(FakeCapture([loud] * 4 + [quiet] * 2), stt, config=config)
+
+    await orchestrator._handle_listening()
+
+    assert stt.calls <= 1
+    assert orchestrator._state is AssistantState.TRANSCRIBING
+
+
+async def test_speculation_cancelled_when_listening_fails():
+    frames = [LOUD] * 5 + [QUIET] * 6
+    stt = SlowSTT()
+    orchestrator = make_orchestrator(FakeCapture(frames, RuntimeError("device lost")), stt)
+    tasks_before = asyncio.all_tasks()
+
+    with pytest.raises(RuntimeError, match="device lost"):
+        await orchestrator._handle_listening()
+    await asyncio.sleep(0)
+
+    assert stt.calls == 1
+    assert asyncio.all_tasks() == tasks_before
+
+
+async def test_queued_synthesis_cancelled_when_agent_fails():
+    tts = BlockedTTS()
+    orchestrator = make_orchestrator(agent=FailingAgent(), tts=tts)
+    orchestrator._state = AssistantState.THINKING
+    tasks_before = asyncio.all_tasks()
+
+    with pytest.raises(RuntimeError, match="model crashed"):
+        await orchestrator._handle_thinking()
+    for _ in range(3):  # Let the cancelled syntheses unwind their TTS streams
+        await asyncio.sleep(0)
+
+    assert tts.started > 0
+    assert asyncio.all_tasks() == tasks_before
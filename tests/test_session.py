@@ -1,4 +1,4 @@
-import time
+from types import SimpleNamespace
 
 import pytest
 
@@ -6,6 +6,14 @@ from src.config.schema import SessionConfig
 from src.core.session import Message, Session
 
 
+@pytest.fixture(autouse=True)
+def clock(monkeypatch):
+    """Session's monotonic clock, advanced by hand instead of read from the OS."""
+    now = [0.0]
+    monkeypatch.setattr("src.core.session.time", SimpleNamespace(monotonic=lambda: now[0]))
+    return now
+
+
 @pytest.fixture
 def session():
     return Session(SessionConfig(idle_timeout_seconds=5.0, max_history_messages=10))
@@ -42,16 +50,17 @@ def test_is_active_after_start(session):
     assert session.is_active
 
 
-def test_is_active_after_timeout(session):
+def test_is_active_after_timeout(session, clock):
     session.start("sys")
-    # Set last activity far in the past to simulate timeout
-    session._last_activity = time.monotonic() - 10.0
+    clock[0] += 10.0
     assert not session.is_active
 
 
-def test_touch_resets_timer(session):
+def test_touch_resets_timer(session, clock):
     session.start("sys")
+    clock[0] += 4.0
     session.touch()
+    clock[0] += 4.0
     assert session.is_active
 
 
@@ -84,9 +93,17 @@ def test_get_ollama_messages_with_tool_calls(session):
 
 def test_history_trimming(session):
     session.start("sys")
-    for i in range(15):
-        session.add_message(Message(role="user", content=f"msg {i}"))
+    session.add_messages(Message(role="user", content=f"msg {i}") for i in range(15))
     # max is 10: system + 9 most recent
     assert len(session.messages) == 10
     assert session.messages[0].role == "system"
     assert session.messages[1].content == "msg 6"
+
+
+def test_get_ollama_messages_reuses_entries(session):
+    session.start("sys")
+    first = session.get_ollama_messages()
+    session.add_message(Message(role="assistant", content="hello"))
+    second = session.get_ollama_messages()
+    assert second[0] is first[0]
+    assert second[1] == {"role": "assistant", "content": "hello"}
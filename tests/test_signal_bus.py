@@ -0,0 +1,15 @@
+from src.core.signal_bus import SignalBus, Signals
+
+
+def test_poll_consumes_signal():
+    bus = SignalBus()
+    bus.emit(Signals.END_SESSION, "bye")
+    assert bus.poll(Signals.END_SESSION) == "bye"
+    assert bus.poll(Signals.END_SESSION) is None
+
+
+def test_signals_are_independent():
+    bus = SignalBus()
+    bus.emit(Signals.SKIP_GREETING)
+    assert bus.poll(Signals.END_SESSION) is None
+    assert bus.poll(Signals.SKIP_GREETING) is True
@@ -2,49 +2,31 @@ import pytest
 
 from src.core.state import AssistantState, validate_transition
 
-
-class TestValidTransitions:
-    def test_waiting_to_listening(self):
-        validate_transition(AssistantState.WAITING, AssistantState.LISTENING)
-
-    def test_listening_to_transcribing(self):
-        validate_transition(AssistantState.LISTENING, AssistantState.TRANSCRIBING)
-
-    def test_listening_to_waiting(self):
-        validate_transition(AssistantState.LISTENING, AssistantState.WAITING)
-
-    def test_transcribing_to_thinking(self):
-        validate_transition(AssistantState.TRANSCRIBING, AssistantState.THINKING)
-
-    def test_transcribing_to_waiting(self):
-        validate_transition(AssistantState.TRANSCRIBING, AssistantState.WAITING)
-
-    def test_thinking_to_speaking(self):
-        validate_transition(AssistantState.THINKING, AssistantState.SPEAKING)
-
-    def test_thinking_to_waiting(self):
-        validate_transition(AssistantState.THINKING, AssistantState.WAITING)
-
-    def test_speaking_to_waiting(self):
-        validate_transition(AssistantState.SPEAKING, AssistantState.WAITING)
-
-    def test_speaking_to_listening(self):
-        validate_transition(AssistantState.SPEAKING, AssistantState.LISTENING)
-
-
-class TestInvalidTransitions:
-    def test_waiting_to_thinking(self):
-        with pytest.raises(ValueError, match="Invalid transition"):
-            validate_transition(AssistantState.WAITING, AssistantState.THINKING)
-
-    def test_waiting_to_speaking(self):
-        with pytest.raises(ValueError, match="Invalid transition"):
-            validate_transition(AssistantState.WAITING, AssistantState.SPEAKING)
-
-    def test_listening_to_speaking(self):
-        with pytest.raises(ValueError, match="Invalid transition"):
-            validate_transition(AssistantState.LISTENING, AssistantState.SPEAKING)
-
-    def test_thinking_to_listening(self):
-        with pytest.raises(ValueError, match="Invalid transition"):
-            validate_transition(AssistantState.THINKING, AssistantState.LISTENING)
+S = AssistantState
+
+
+@pytest.mark.parametrize("current,target", [
+    (S.WAITING, S.LISTENING),
+    (S.LISTENING, S.TRANSCRIBING),
+    (S.LISTENING, S.WAITING),
+    (S.TRANSCRIBING, S.THINKING),
+    (S.TRANSCRIBING, S.WAITING),
+    (S.THINKING, S.SPEAKING),
+    (S.THINKING, S.WAITING),
+    (S.SPEAKING, S.WAITING),
+    (S.SPEAKING, S.LISTENING),
+])
+def test_valid_transition(current, target):
+    validate_transition(current, target)
+
+
+@pytest.mark.parametrize("current,target", [
+    (S.WAITING, S.THINKING),
+    (S.WAITING, S.SPEAKING),
+    (S.LISTENING, S.SPEAKING),
+    (S.THINKING, S.LISTENING),
+])
+def test_invalid_transition(current, target):
+    with pytest.raises(ValueError) as exc:
+        validate_transition(current, target)
+    assert "Invalid transition" in str(exc.value)
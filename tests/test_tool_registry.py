@@ -1,11 +1,10 @@
 import pytest
 
-from src.tools.base import ToolDefinition, ToolParameter
 from src.tools.builtin.device_control import DeviceControlTool
 from src.tools.registry import ToolRegistry
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def registry():
     r = ToolRegistry()
     r.register(DeviceControlTool())
@@ -54,7 +53,6 @@ def test_to_ollama_tools(registry):
     assert action_prop["enum"] == ["on", "off"]
 
 
-@pytest.mark.asyncio
 async def test_call_tool_success(registry):
     result = await registry.call_tool("device_control", {
         "device_name": "living_room_light",
@@ -64,14 +62,12 @@ async def test_call_tool_success(registry):
     assert "living_room_light" in result
 
 
-@pytest.mark.asyncio
 async def test_call_tool_unknown(registry):
     result = await registry.call_tool("nonexistent", {})
     assert "Error" in result
     assert "Unknown tool" in result
 
 
-@pytest.mark.asyncio
 async def test_call_tool_invalid_action(registry):
     result = await registry.call_tool("device_control", {
         "device_name": "lamp",
@@ -81,7 +77,6 @@ async def test_call_tool_invalid_action(registry):
     assert "Invalid action" in result
 
 
-@pytest.mark.asyncio
 async def test_call_tool_missing_device(registry):
     result = await registry.call_tool("device_control", {"action": "on"})
     assert "Error" in result
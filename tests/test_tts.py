@@ -0,0 +1,45 @@
+import sys
+import types
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+
+from src.config.schema import TTSConfig
+from src.services.tts import SynthesisError, TextToSpeechService
+
+
+class FakeVoice:
+    """Yields one audio chunk per word, like Piper does per sentence."""
+
+    def synthesize(self, text, syn_config):
+        for word in text.split():
+            if word == "boom":
+                raise RuntimeError("voice failed")
+            yield SimpleNamespace(audio_int16_bytes=word.encode())
+
+
+@pytest.fixture
+def tts():
+    config_module = types.ModuleType("piper.config")
+    config_module.SynthesisConfig = lambda **kwargs: kwargs
+    modules = {"piper": types.ModuleType("piper"), "piper.config": config_module}
+    with patch.dict(sys.modules, modules):
+        service = TextToSpeechService(TTSConfig())
+        service._voice = FakeVoice()
+        yield service
+
+
+async def test_synthesize_stream_yields_chunks_in_order(tts):
+    chunks = [chunk async for chunk in tts.synthesize_stream("one two three")]
+    assert chunks == [b"one", b"two", b"three"]
+
+
+async def test_synthesize_joins_chunks(tts):
+    assert await tts.synthesize("one two") == b"onetwo"
+
+
+async def test_synthesize_stream_raises_synthesis_error(tts):
+    with pytest.raises(SynthesisError, match="voice failed"):
+        async for _ in tts.synthesize_stream("one boom"):
+            pass
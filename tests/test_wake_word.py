@@ -0,0 +1,132 @@
+import asyncio
+import sys
+import types
+from unittest.mock import patch
+
+import numpy as np
+import pytest
+
+from src.config.schema import WakeWordConfig
+from src.services.wake_word import OpenWakeWordService
+
+
+class FakeModel:
+    """Scores audio as a detection when it is not silent."""
+
+    def __init__(self, **kwargs) -> None:
+        self.calls = 0
+        self.resets = 0
+        self.samples = 0
+
+    def predict(self, audio: np.ndarray) -> dict[str, float]:
+        self.calls += 1
+        self.samples += audio.size
+        return {"hey_jarvis": 1.0 if audio.any() else 0.0}
+
+    def reset(self) -> None:
+        self.resets += 1
+
+
+@pytest.fixture
+def fake_openwakeword():
+    module = types.ModuleType("openwakeword.model")
+    module.Model = FakeModel
+    modules = {"openwakeword": types.ModuleType("openwakeword"), "openwakeword.model": module}
+    with patch.dict(sys.modules, modules), \
+            patch("src.services.wake_word.platform.system", return_value="Linux"):
+        yield
+
+
+async def test_disabled_service_never_waits_or_queues():
+    with patch("src.services.wake_word.platform.system", return_value="Darwin"):
+        service = OpenWakeWordService(WakeWordConfig())
+    await service.start()
+
+    waiter = asyncio.create_task(service.wait_for_wake_word())
+    await asyncio.sleep(0)
+    service.feed(np.ones(1280, dtype=np.int16))
+
+    assert await waiter is False
+    assert service._frames.empty()
+    await service.stop()
+
+
+async def test_wait_for_wake_word_resolves_from_detection_thread(fake_openwakeword):
+    service = OpenWakeWordService(WakeWordConfig())
+    await service.start()
+
+    waiter = asyncio.create_task(service.wait_for_wake_word())
+    await asyncio.sleep(0)
+    service.feed(np.zeros(1280, dtype=np.int16))
+    service.feed(np.ones(1280, dtype=np.int16))
+
+    assert await waiter is True
+    await service.stop()
+
+
+async def test_wait_for_wake_word_returns_false_on_stop(fake_openwakeword):
+    service = OpenWakeWordService(WakeWordConfig())
+    await service.start()
+
+    waiter = asyncio.create_task(service.wait_for_wake_word())
+    await asyncio.sleep(0)
+    await service.stop()
+
+    assert await waiter is False
+
+
+async def test_reset_skipped_until_audio_is_scored(fake_openwakeword):
+    service = OpenWakeWordService(WakeWordConfig())
+    await service.start()
+    model = service._model
+    resets_after_warmup = model.resets
+
+    await service.reset()
+    assert model.resets == resets_after_warmup
+
+    waiter = asyncio.create_task(service.wait_for_wake_word())
+    await asyncio.sleep(0)
+    service.feed(np.ones(1280, dtype=np.int16))
+    await waiter
+
+    await service.reset()
+    assert model.resets == resets_after_warmup + 1
+    await service.stop()
+
+
+async def test_backlogged_frames_scored_in_one_call(fake_openwakeword):
+    service = OpenWakeWordService(WakeWordConfig(max_batch_frames=4))
+    await service.start()
+    model = service._model
+    calls_after_warmup = model.calls
+
+    # Queue the backlog before the detection thread can drain it one frame at a time
+    with service._model_lock:
+        waiter = asyncio.create_task(service.wait_for_wake_word())
+        await asyncio.sleep(0)
+        for _ in range(3):
+            service.feed(np.zeros(1280, dtype=np.int16))
+        service.feed(np.ones(1280, dtype=np.int16))
+
+    assert await waiter is True
+    assert model.calls - calls_after_warmup <= 2
+    await service.stop()
+
+
+async def test_long_quiet_stretch_skips_model(fake_openwakeword):
+    service = OpenWakeWordService(WakeWordConfig(max_batch_frames=1000))
+    await service.start()
+    model = service._model
+    samples_after_warmup = model.samples
+
+    waiter = asyncio.create_task(service.wait_for_wake_word())
+    await asyncio.sleep(0)
+    for _ in range(100):
+        service.feed(np.zeros(1280, dtype=np.int16))
+    while not service._frames.empty():
+        await asyncio.sleep(0.001)
+    service.feed(np.full(1280, 1000, dtype=np.int16))
+
+    assert await waiter is True
+    assert model.samples - samples_after_warmup < 100 * 1280
+    await service.stop()
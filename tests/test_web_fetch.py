@@ -0,0 +1,68 @@
+import httpx
+
+from src.tools.builtin import web_fetch
+from src.tools.builtin.web_fetch import WebFetchTool, _extract_urls
+
+
+def test_extract_urls_keeps_http_and_https():
+    valid, errors = _extract_urls("summarize https://a.com/x and HTTP://b.org?q=1 please")
+    assert valid == ["https://a.com/x", "HTTP://b.org?q=1"]
+    assert errors == []
+
+
+def test_extract_urls_reports_bad_urls():
+    valid, errors = _extract_urls("ftp://files.example.com https:///no-host")
+    assert valid == []
+    assert errors == [
+        "Unsupported protocol in URL: 'ftp://files.example.com'. "
+        "Only http and https are supported.",
+        "Malformed URL detected: 'https:///no-host'.",
+    ]
+
+
+def fetch_tool(handler) -> WebFetchTool:
+    """A tool whose HTTP client is served by handler instead of the network."""
+    return WebFetchTool(httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+
+async def test_execute_strips_non_text_markup():
+    html = (
+        "<html><body><p>Hello</p>"
+        "<div><script>x()</script><svg><text>s</text></svg></div></body></html>"
+    )
+    tool = fetch_tool(lambda request: httpx.Response(200, html=html))
+
+    result = await tool.execute(prompt="read https://example.com")
+
+    assert result == "Fetched content from https://example.com:\n\nHello"
+
+
+async def test_execute_stops_download_at_cap():
+    sent = 0
+
+    async def body():
+        nonlocal sent
+        while True:
+            sent += 1
+            yield b"a" * 65_536
+
+    headers = {"content-type": "text/plain"}
+    tool = fetch_tool(lambda request: httpx.Response(200, content=body(), headers=headers))
+
+    result = await tool.execute(prompt="read https://example.com")
+
+    assert result.endswith("a" * web_fetch.MAX_CONTENT_LENGTH)
+    assert sent * 65_536 < web_fetch.MAX_DOWNLOAD_BYTES + 2 * 65_536
+
+
+async def test_execute_fetches_all_urls_in_order():
+    def handler(request):
+        return httpx.Response(200, text=request.url.host, headers={"content-type": "text/plain"})
+
+    result = await fetch_tool(handler).execute(prompt="compare https://a.com and https://b.com")
+
+    assert result == (
+        "Fetched content from https://a.com:\n\na.com"
+        "\n\n---\n\n"
+        "Fetched content from https://b.com:\n\nb.com"
+    )